@@ -0,0 +1,352 @@
+import argparse
+import json
+import queue
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
+
+import archive
+import benchmark
+import evidence
+import metrics
+import stats
+import store
+import summary
+import trends
+import validate
+from rubric import RUBRIC_VERSION, questions_data
+
+# Fields a submitted score may carry; Saved At is filled by the store. Scores
+# can only be submitted to the active round, which Round defaults to.
+FIELDS = ["Round", "Institution", "Assessor", "Question", "Key Aspect", "Item", "Score", "Comments"]
+
+# Largest request body accepted, in bytes, for scores and evidence files
+MAX_BODY = 4 * 1024 * 1024
+MAX_EVIDENCE = 200 * 1024 * 1024
+
+# Group commit: the writer waits up to GROUP_WAIT seconds for more batches
+# and writes at most MAX_GROUP_ROWS rows to the store in one save
+GROUP_WAIT = 0.02
+MAX_GROUP_ROWS = 20000
+
+# Batches waiting for the writer; further submissions get 503 until it
+# catches up, so latency stays bounded under overload
+MAX_PENDING = 1000
+
+# Longest a request waits for its batch to be written
+SAVE_TIMEOUT = 30
+
+metrics.HELP.update({
+    "hurs_api_requests_total": "JSON API requests by endpoint and status",
+    "hurs_api_rows_total": "Score rows saved through the JSON API",
+    "hurs_api_group_rows": "Rows written by one group commit",
+    "hurs_api_submit_seconds": "Time from receiving a submission to its rows being saved",
+})
+
+_pending = queue.Queue(maxsize=MAX_PENDING)
+_writer = None
+_writer_lock = threading.Lock()
+
+
+class Submission:
+    def __init__(self, records):
+        self.records = records
+        self.done = threading.Event()
+        self.errors = None
+        self.error = None
+
+
+def parse_records(payload):
+    # A list of score objects, or {"scores": [...]}
+    records = payload.get("scores") if isinstance(payload, dict) else payload
+    if not isinstance(records, list) or not records or not all(isinstance(r, dict) for r in records):
+        raise ValueError('expected a non-empty list of score objects, or {"scores": [...]}')
+    return records
+
+
+def to_frame(records):
+    rows = pd.DataFrame.from_records(records).reindex(columns=FIELDS)
+    for column in ["Institution", "Assessor", "Question", "Key Aspect", "Item", "Comments"]:
+        rows[column] = rows[column].fillna("").astype(str)
+    rows["Round"] = rows["Round"].astype(object).where(rows["Round"].notna(), None)
+    return rows
+
+
+def check_rows(rows):
+    # Error label per row, None when the row can be saved. Repeats of a key
+    # are allowed: the last one wins, as in the app. Unlike rows already in
+    # the store, submissions must name a rubric item.
+    violations = validate.find_violations(rows).where(lambda v: v != "Duplicate submission")
+    violations = violations.where(rows["Item"].str.strip() != "", "Missing item")
+    missing = (rows["Institution"].str.strip() == "") | (rows["Assessor"].str.strip() == "")
+    violations = violations.where(~missing, "Missing institution or assessor")
+    closed = rows["Round"].notna() & (rows["Round"].astype(str) != store.CURRENT_ROUND)
+    return violations.where(~closed, f"Round is not open; scores go to round {store.CURRENT_ROUND}").to_numpy()
+
+
+def _take_group():
+    # Block for the first batch, then gather whatever else arrives within
+    # GROUP_WAIT so concurrent submissions share one store write
+    group = [_pending.get()]
+    rows = len(group[0].records)
+    deadline = time.monotonic() + GROUP_WAIT
+    while rows < MAX_GROUP_ROWS:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            submission = _pending.get(timeout=remaining)
+        except queue.Empty:
+            break
+        group.append(submission)
+        rows += len(submission.records)
+    return group
+
+
+def _save_group(group):
+    # Validate and save every batch of the group in one pass each; a batch
+    # with any failing row is rejected whole
+    rows = to_frame([record for submission in group for record in submission.records])
+    violations = check_rows(rows)
+    keep = np.ones(len(rows), dtype=bool)
+    start = 0
+    for submission in group:
+        end = start + len(submission.records)
+        failing = np.flatnonzero(pd.notna(violations[start:end]))
+        if len(failing):
+            submission.errors = [{"row": int(i), "error": violations[start + i]} for i in failing]
+            keep[start:end] = False
+        start = end
+
+    rows = rows[keep]
+    if not rows.empty:
+        rows["Round"] = store.CURRENT_ROUND
+        rows["Score"] = pd.to_numeric(rows["Score"])
+        store.save_scores(rows)
+        metrics.inc("hurs_api_rows_total", len(rows))
+        metrics.observe("hurs_api_group_rows", len(rows), buckets=(1, 10, 100, 1000, 10000, 100000))
+
+
+def _write_groups():
+    while True:
+        group = _take_group()
+        try:
+            _save_group(group)
+        except Exception as error:  # reported to every waiting request
+            for submission in group:
+                submission.error = repr(error)
+        for submission in group:
+            submission.done.set()
+
+
+def start_writer():
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = threading.Thread(target=_write_groups, name="hurs-api-writer", daemon=True)
+            _writer.start()
+
+
+def _finite(value):
+    # JSON has no NaN; single-score groups have no spread or interval
+    return None if not np.isfinite(value) else float(value)
+
+
+def indicator_aggregates(questions=None):
+    # Indicator-level running statistics, read from the shared state that
+    # every save keeps up to date
+    table = store.load_scores()
+    groups = stats.load_stats(table)
+    wanted = set(questions) if questions else None
+    result = {}
+    for (question, aspect, item), acc in groups.items():
+        if aspect is None and (wanted is None or question in wanted):
+            ci_low, ci_high = acc.ci
+            result[question] = {
+                "count": acc.n,
+                "mean": _finite(acc.mean),
+                "std": _finite(acc.std),
+                "ci_low": _finite(ci_low),
+                "ci_high": _finite(ci_high),
+            }
+    return result
+
+
+def institution_means(institution, round_=None):
+    table = store.query_live(
+        store.filter_expression(rounds=[round_] if round_ else None, institutions=[institution]),
+        columns=["Question", "Score"],
+    )
+    means = table.group_by("Question").aggregate([("Score", "mean"), ("Score", "count")])
+    return {
+        question: {"mean": mean, "count": count}
+        for question, mean, count in zip(
+            means["Question"].to_pylist(), means["Score_mean"].to_pylist(), means["Score_count"].to_pylist()
+        )
+    }
+
+
+class BodyReader:
+    # The request body as a stream that stops at Content-Length
+    def __init__(self, rfile, length):
+        self.rfile = rfile
+        self.remaining = length
+
+    def read(self, size):
+        chunk = self.rfile.read(min(size, self.remaining)) if self.remaining else b""
+        self.remaining -= len(chunk)
+        return chunk
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _send(self, status, payload, endpoint):
+        body = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if status == 503:
+            self.send_header("Retry-After", "1")
+        self.end_headers()
+        self.wfile.write(body)
+        metrics.inc("hurs_api_requests_total", endpoint=endpoint, status=str(status))
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path == "/evidence":
+            self.post_evidence({name: values[0] for name, values in parse_qs(url.query).items()})
+            return
+        if url.path != "/scores":
+            self._send(404, {"error": "not found"}, "other")
+            return
+        start = time.perf_counter()
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY:
+            self.close_connection = True
+            self._send(413, {"error": f"body larger than {MAX_BODY} bytes"}, "scores")
+            return
+        try:
+            records = parse_records(json.loads(self.rfile.read(length)))
+        except ValueError as error:
+            self._send(400, {"error": str(error)}, "scores")
+            return
+
+        submission = Submission(records)
+        try:
+            _pending.put_nowait(submission)
+        except queue.Full:
+            self._send(503, {"error": "too many pending submissions"}, "scores")
+            return
+        if not submission.done.wait(SAVE_TIMEOUT):
+            self._send(504, {"error": "save did not finish in time"}, "scores")
+            return
+        if submission.error:
+            self._send(500, {"error": submission.error}, "scores")
+            return
+        if submission.errors:
+            self._send(400, {"error": "invalid scores", "rows": submission.errors}, "scores")
+            return
+
+        metrics.observe("hurs_api_submit_seconds", time.perf_counter() - start)
+        questions = {record.get("Question") for record in records}
+        self._send(200, {"saved": len(records), "aggregates": indicator_aggregates(questions)}, "scores")
+
+    def post_evidence(self, params):
+        # Raw file body, streamed into the evidence store; the rubric item
+        # and file name come from the query string
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_EVIDENCE:
+            self.close_connection = True
+            self._send(413, {"error": f"file larger than {MAX_EVIDENCE} bytes"}, "evidence")
+            return
+        fields = ["name", "institution", "assessor", "question", "aspect", "item"]
+        if not all(params.get(field) for field in fields):
+            self.close_connection = True
+            self._send(400, {"error": f"query parameters required: {', '.join(fields)}"}, "evidence")
+            return
+        try:
+            digest, added = evidence.attach(
+                BodyReader(self.rfile, length),
+                params["name"], params["institution"], params["assessor"],
+                params["question"], params["aspect"], params["item"],
+                round_=params.get("round"),
+            )
+        except ValueError as error:  # rejected before the body was read
+            self.close_connection = True
+            self._send(400, {"error": str(error)}, "evidence")
+            return
+        self._send(200, {"hash": digest, "added": added}, "evidence")
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {name: values[0] for name, values in parse_qs(url.query).items()}
+        if url.path == "/aggregates":
+            if "institution" in params:
+                payload = institution_means(params["institution"], params.get("round"))
+            elif "question" in params:
+                table = store.load_scores()
+                groups = stats.load_stats(table)
+                frame = stats.summary_frame(groups, params["question"])
+                payload = frame.astype(object).where(frame.notna(), None).to_dict("records")
+            else:
+                payload = indicator_aggregates()
+            self._send(200, payload, "aggregates")
+        elif url.path == "/figure" and "question" in params:
+            # Bar chart of one question as Plotly JSON, from the shared cache
+            table = store.load_scores()
+            spec = summary.figure_json(table, store.table_version(table), params["question"])
+            if spec is None:
+                self._send(404, {"error": "no scores for this question"}, "figure")
+            else:
+                self._send(200, spec.encode("utf-8"), "figure")
+        elif url.path == "/benchmark" and "institution" in params:
+            # Percentile card; any other parameter filters peers by that
+            # institutions.csv attribute, comma-separated values allowed
+            table = store.load_scores()
+            version = store.table_version(table)
+            views = trends.load_views(table, archive.history())
+            filters = {
+                name: value.split(",") for name, value in params.items() if name not in ("institution", "round")
+            }
+            index, means = benchmark.peer_index(views, version, params.get("round", store.CURRENT_ROUND), filters)
+            frame = benchmark.card(index, means, params["institution"])
+            self._send(200, frame.astype(object).where(frame.notna(), None).to_dict("records"), "benchmark")
+        elif url.path == "/rubric":
+            self._send(200, {"version": RUBRIC_VERSION, "questions": questions_data}, "rubric")
+        else:
+            self._send(404, {"error": "not found"}, "other")
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ApiServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Many clients connect at once when an assessment window opens
+    request_queue_size = 256
+
+
+def serve(host, port):
+    start_writer()
+    return ApiServer((host, port), ApiHandler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON API for submitting HURS scores in batches")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8700)
+    args = parser.parse_args()
+
+    store.init_store()
+    server = serve(args.host, args.port)
+    print(f"Serving the HURS score API on http://{args.host}:{args.port}/scores")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
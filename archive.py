@@ -0,0 +1,114 @@
+import argparse
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+import store
+import trends
+
+# Closed assessment rounds, one Parquet partition per round and institution:
+# archive/Round=2025/Institution=.../part-0.parquet
+archive_dir = Path("archive")
+
+PARTITIONING = ds.partitioning(
+    pa.schema([("Round", pa.string()), ("Institution", pa.string())]), flavor="hive"
+)
+
+
+def history():
+    if not archive_dir.exists():
+        return None
+    return ds.dataset(archive_dir, format="parquet", partitioning=PARTITIONING, schema=store.SCHEMA)
+
+
+def archived_rounds():
+    if not archive_dir.exists():
+        return []
+    return sorted(path.name.split("=", 1)[1] for path in archive_dir.glob("Round=*"))
+
+
+def read_history(rounds=None, institutions=None, questions=None, columns=None, expression=None):
+    # Conditions on Round and Institution prune whole partition directories;
+    # the rest are pushed down to the Parquet row groups
+    dataset = history()
+    if dataset is None:
+        return store.SCHEMA.empty_table().select(columns or store.COLUMNS)
+    if expression is None:
+        expression = store.filter_expression(rounds=rounds, institutions=institutions, questions=questions)
+    return dataset.to_table(columns=columns, filter=expression)
+
+
+def close_round(round_):
+    # Archive every live row of the round, then drop the round from the live
+    # store so reruns only parse the active round
+    if round_ == store.CURRENT_ROUND:
+        raise ValueError(f"Round {round_} is the active round and cannot be closed")
+
+    with store.write_lock():
+        return _archive_round(round_)
+
+
+def _archive_round(round_):
+    live = store.load_scores()
+    rows = live.filter(pc.equal(live["Round"], round_))
+    if not rows.num_rows:
+        return 0
+
+    # Partitions being rewritten are replaced, so carry over what is already
+    # archived for them unless the live rows supersede it
+    if round_ in archived_rounds():
+        archived = read_history(rounds=[round_]).to_pandas()
+        live_rows = rows.to_pandas()
+        archived = archived[~store.key_mask(archived, live_rows)]
+        rows = pa.Table.from_pandas(pd.concat([archived, live_rows]), schema=store.SCHEMA, preserve_index=False)
+
+    ds.write_dataset(
+        rows,
+        archive_dir,
+        format="parquet",
+        partitioning=PARTITIONING,
+        basename_template="part-{i}.parquet",
+        existing_data_behavior="delete_matching",
+        file_options=ds.ParquetFileFormat().make_write_options(compression="zstd"),
+    )
+    trends.set_archived(round_, rows)
+    return store.remove_rounds([round_])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Archive closed HURS assessment rounds to partitioned Parquet")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    close = commands.add_parser("close", help="archive rounds and drop them from the live store")
+    close.add_argument("rounds", nargs="*", help="rounds to close (default: every round but the active one)")
+
+    commands.add_parser("list", help="list archived rounds")
+
+    query = commands.add_parser("query", help="export archived rows, reading only matching partitions")
+    query.add_argument("--round", action="append", dest="rounds")
+    query.add_argument("--institution", action="append", dest="institutions")
+    query.add_argument("--question", action="append", dest="questions")
+    query.add_argument("-o", "--output", default="history.csv")
+
+    args = parser.parse_args()
+    if args.command == "close":
+        live = store.load_scores()
+        rounds = args.rounds or [
+            r for r in pc.unique(live["Round"].drop_null()).to_pylist() if r != store.CURRENT_ROUND
+        ]
+        for round_ in rounds:
+            print(f"Round {round_}: archived {close_round(round_)} rows")
+    elif args.command == "list":
+        for round_ in archived_rounds():
+            print(round_)
+    else:
+        table = read_history(args.rounds, args.institutions, args.questions)
+        Path(args.output).write_bytes(store.export_csv(table))
+        print(f"Exported {table.num_rows} archived rows to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+import argparse
+import gzip
+import json
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+import changefeed
+import export
+import statefile
+import store
+
+# Checkpoints: full compressed bases plus deltas of the change feed between them
+backup_dir = Path("backups")
+manifest_file = backup_dir / "manifest.json"
+
+# Start a new base once this many deltas have piled up on the current one,
+# which bounds how many deltas a restore has to replay
+REBASE_DELTAS = 100
+
+
+def load_manifest():
+    if not manifest_file.exists():
+        return []
+    return json.loads(manifest_file.read_text())
+
+
+def _save_manifest(checkpoints):
+    statefile.write_text(manifest_file, json.dumps(checkpoints, indent=1))
+
+
+def _take_base():
+    # Live rows plus every archived round: closing a round moves its rows out
+    # of the live store without change events, so only the base can carry
+    # them. Under the write lock the offset, the live rows and the archive
+    # all describe the same moment; where a key is both live and archived
+    # the live row is the current one.
+    with store.write_lock():
+        offset = changefeed.last_offset()
+        frame = export.query_scores().to_pandas().drop_duplicates(subset=store.KEY, keep="first")
+    timestamp = datetime.now(timezone.utc).isoformat()
+    path = backup_dir / f"base-{offset:012d}.parquet"
+    pq.write_table(pa.Table.from_pandas(frame, schema=store.SCHEMA, preserve_index=False), path, compression="zstd")
+    return {"kind": "base", "offset": offset, "ts": timestamp, "file": path.name}
+
+
+def _take_delta(since):
+    events = []
+    while True:
+        batch, since = changefeed.read_events(since, changefeed.DEFAULT_BATCH)
+        if not batch:
+            break
+        events.extend(batch)
+    if not events:
+        return None
+
+    first, last = events[0]["offset"], events[-1]["offset"]
+    path = backup_dir / f"delta-{first:012d}-{last:012d}.jsonl.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.writelines(json.dumps(event) + "\n" for event in events)
+    return {"kind": "delta", "from": first, "offset": last, "ts": events[-1]["ts"], "file": path.name}
+
+
+def take_backup():
+    # A delta only reads the events after the last checkpoint, so frequent
+    # backups cost time in proportion to the changes since the previous one
+    backup_dir.mkdir(exist_ok=True)
+    checkpoints = load_manifest()
+    last_base = max((i for i, c in enumerate(checkpoints) if c["kind"] == "base"), default=None)
+
+    if last_base is None or len(checkpoints) - 1 - last_base >= REBASE_DELTAS:
+        checkpoint = _take_base()
+    else:
+        checkpoint = _take_delta(checkpoints[-1]["offset"])
+        if checkpoint is None:
+            return None
+
+    checkpoints.append(checkpoint)
+    _save_manifest(checkpoints)
+    return checkpoint
+
+
+def _read_delta(path):
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def restore(as_of_offset=None, as_of_time=None, round_=None):
+    # Latest base at or before the target, plus the deltas after it replayed
+    # up to the target. Events are applied per key, last one wins.
+    def before_target(checkpoint_or_event):
+        if as_of_offset is not None and checkpoint_or_event["offset"] > as_of_offset:
+            return False
+        if as_of_time is not None and checkpoint_or_event["ts"] > as_of_time:
+            return False
+        return True
+
+    checkpoints = load_manifest()
+    bases = [c for c in checkpoints if c["kind"] == "base" and before_target(c)]
+    if not bases:
+        raise ValueError("No backup was taken at or before the requested point")
+    base = bases[-1]
+
+    frame = pq.read_table(backup_dir / base["file"]).to_pandas()
+    events = [
+        event
+        for c in checkpoints
+        if c["kind"] == "delta" and c["offset"] > base["offset"]
+        for event in _read_delta(backup_dir / c["file"])
+        if event["offset"] > base["offset"] and before_target(event)
+    ]
+    if events:
+        changes = pd.DataFrame([{**event["row"], "op": event["op"], "offset": event["offset"]} for event in events])
+        changes = changes.reindex(columns=store.COLUMNS + ["op", "offset"])
+        changes = changes.sort_values("offset").drop_duplicates(subset=store.KEY, keep="last")
+        frame = frame[~store.key_mask(frame, changes)]
+        frame = pd.concat([frame, changes[changes["op"] != "delete"][store.COLUMNS]], ignore_index=True)
+
+    if round_ is not None:
+        frame = frame[frame["Round"] == round_]
+    return frame.reset_index(drop=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incremental backups of the HURS score store")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("take", help="take one base or delta checkpoint")
+
+    watch = commands.add_parser("watch", help="take a checkpoint every interval")
+    watch.add_argument("--interval", type=int, default=300, help="seconds between checkpoints")
+
+    commands.add_parser("list", help="list checkpoints")
+
+    restore_cmd = commands.add_parser("restore", help="write the store as of a point in time")
+    restore_cmd.add_argument("--offset", type=int, help="last change feed offset to include")
+    restore_cmd.add_argument("--time", help="ISO UTC timestamp, e.g. 2026-03-01T12:00:00+00:00")
+    restore_cmd.add_argument("--round", help="keep only rows of this assessment round")
+    restore_cmd.add_argument("-o", "--output", default="scores_restored.csv")
+
+    args = parser.parse_args()
+    if args.command == "take":
+        print(take_backup() or "No changes since the last checkpoint")
+    elif args.command == "watch":
+        while True:
+            checkpoint = take_backup()
+            if checkpoint:
+                print(checkpoint)
+            time.sleep(args.interval)
+    elif args.command == "list":
+        for checkpoint in load_manifest():
+            print(checkpoint)
+    else:
+        frame = restore(args.offset, args.time, args.round)
+        frame.to_csv(args.output, index=False)
+        print(f"Restored {len(frame)} rows to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
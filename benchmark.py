@@ -0,0 +1,166 @@
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import trends
+
+# Optional peer attributes: an Institution column plus any others to filter
+# peer groups on, e.g. Size and Region
+profiles_file = Path("institutions.csv")
+
+# Peer groups whose sorted scores are kept in memory at once
+MAX_GROUPS = 32
+
+# Sorted indexes per (round, peer group) and the institution means they
+# were built from, shared by every session in the process
+_indexes = OrderedDict()
+_means = None
+_profiles = None
+_lock = threading.Lock()
+
+
+class PeerIndex:
+    # Mean scores of one peer group, sorted per indicator and per category.
+    # Lookups are binary searches; when scores change only the changed
+    # institutions are moved within each array.
+
+    def __init__(self, members):
+        self.members = members
+        self.version = None
+        self.sorted = {}
+        self.scores = {}
+
+    def update(self, means, version):
+        for key, by_institution in means.items():
+            if self.members is not None:
+                by_institution = {i: v for i, v in by_institution.items() if i in self.members}
+            old = self.scores.get(key, {})
+            changed = [i for i in set(old) | set(by_institution) if old.get(i) != by_institution.get(i)]
+            if key not in self.sorted or len(changed) * 4 > len(by_institution):
+                self.sorted[key] = np.sort(np.fromiter(by_institution.values(), float, len(by_institution)))
+            else:
+                values = self.sorted[key]
+                for institution in changed:
+                    if institution in old:
+                        values = np.delete(values, np.searchsorted(values, old[institution]))
+                    if institution in by_institution:
+                        value = by_institution[institution]
+                        values = np.insert(values, np.searchsorted(values, value), value)
+                self.sorted[key] = values
+            self.scores[key] = by_institution
+        for key in set(self.sorted) - set(means):
+            del self.sorted[key], self.scores[key]
+        self.version = version
+
+    def percentile(self, key, value):
+        # Mid-rank percentile of value among the peers: ties count half
+        values = self.sorted.get(key)
+        if values is None or not len(values):
+            return np.nan
+        below = np.searchsorted(values, value, side="left")
+        at_or_below = np.searchsorted(values, value, side="right")
+        return 100 * (below + at_or_below) / (2 * len(values))
+
+    def quantile(self, key, q):
+        values = self.sorted.get(key)
+        if values is None or not len(values):
+            return np.nan
+        return values[min(int(q * len(values)), len(values) - 1)]
+
+
+def cache_info():
+    # (peer groups, bytes of sorted arrays) held in memory
+    with _lock:
+        indexes = list(_indexes.values())
+    return len(indexes), sum(values.nbytes for index in indexes for values in index.sorted.values())
+
+
+def load_profiles():
+    # Re-read only when institutions.csv changes
+    global _profiles
+    if not profiles_file.exists():
+        return pd.DataFrame(columns=["Institution"])
+    mtime = profiles_file.stat().st_mtime_ns
+    if _profiles is None or _profiles[0] != mtime:
+        _profiles = (mtime, pd.read_csv(profiles_file, dtype=str, keep_default_na=False))
+    return _profiles[1]
+
+
+def peer_members(filters):
+    # Institutions matching every {attribute: [values]} filter; None is everyone
+    filters = {attribute: values for attribute, values in (filters or {}).items() if values}
+    if not filters:
+        return None
+    profiles = load_profiles()
+    mask = np.ones(len(profiles), dtype=bool)
+    for attribute, values in filters.items():
+        mask &= profiles[attribute].isin(values).to_numpy() if attribute in profiles else False
+    return frozenset(profiles["Institution"][mask])
+
+
+def institution_means(views, round_):
+    # {(level, indicator or category): {institution: mean score}} from the
+    # materialized per-round views
+    means = {}
+    for (level, institution, key), (total, count) in views.get(round_, {}).items():
+        if institution and count:
+            means.setdefault((level, key), {})[institution] = total / count
+    return means
+
+
+def peer_index(views, version, round_, filters=None):
+    global _means
+    members = peer_members(filters)
+    group = (round_, members)
+    with _lock:
+        if _means is None or _means[:2] != (version, round_):
+            _means = (version, round_, institution_means(views, round_))
+        means = _means[2]
+        index = _indexes.get(group)
+        if index is None:
+            index = _indexes[group] = PeerIndex(members)
+            while len(_indexes) > MAX_GROUPS:
+                _indexes.popitem(last=False)
+        _indexes.move_to_end(group)
+        if index.version != version:
+            index.update(means, version)
+        return index, means
+
+
+def cards(index, means, institutions=None):
+    # One row per institution and indicator or category it was scored on;
+    # each key's percentiles come from two vectorized binary searches
+    wanted = None if institutions is None else set(institutions)
+    columns = {name: [] for name in ["Institution", "Level", "Indicator / Category", "Score", "Percentile",
+                                     "Peer Median", "Peer Q1", "Peer Q3", "Peers"]}
+    for (level, key), by_institution in means.items():
+        names = [i for i in by_institution if wanted is None or i in wanted]
+        values = index.sorted.get((level, key))
+        if not names or values is None or not len(values):
+            continue
+        scores = np.array([by_institution[i] for i in names])
+        below = np.searchsorted(values, scores, side="left")
+        at_or_below = np.searchsorted(values, scores, side="right")
+        n = len(names)
+        columns["Institution"].append(names)
+        columns["Level"].append([level] * n)
+        columns["Indicator / Category"].append([key] * n)
+        columns["Score"].append(scores)
+        columns["Percentile"].append(100 * (below + at_or_below) / (2 * len(values)))
+        for name, q in [("Peer Median", 0.5), ("Peer Q1", 0.25), ("Peer Q3", 0.75)]:
+            columns[name].append(np.full(n, index.quantile((level, key), q)))
+        columns["Peers"].append(np.full(n, len(values)))
+    if not columns["Score"]:
+        return pd.DataFrame()
+    frame = pd.DataFrame({name: np.concatenate(parts) for name, parts in columns.items()})
+    frame["order"] = frame["Level"].map({level: i for i, level in enumerate(reversed(list(trends.LEVELS)))})
+    frame = frame.sort_values(["Institution", "order", "Indicator / Category"]).drop(columns="order")
+    return frame.reset_index(drop=True)
+
+
+def card(index, means, institution):
+    frame = cards(index, means, [institution])
+    return frame.drop(columns="Institution") if not frame.empty else frame
@@ -0,0 +1,169 @@
+import argparse
+import json
+import math
+import os
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import statefile
+
+# Ordered log of score inserts, updates and deletes, one JSON event per line
+events_file = Path("score_events.jsonl")
+
+DEFAULT_BATCH = 1000
+
+
+def _clean(row):
+    return {k: None if isinstance(v, float) and math.isnan(v) else v for k, v in row.items()}
+
+
+def _complete_end(f):
+    # End of the last complete line; a crash mid-write can leave a trailing
+    # line without its newline
+    end = f.seek(0, os.SEEK_END)
+    block = 4096
+    while end:
+        start = max(0, end - block)
+        f.seek(start)
+        newline = f.read(end - start).rfind(b"\n")
+        if newline >= 0:
+            return start + newline + 1
+        if not start:
+            return 0
+        end = start
+    return 0
+
+
+def _last_offset(f):
+    # Offsets only grow, so the last complete line holds the latest one
+    end = _complete_end(f)
+    block = 4096
+    while True:
+        start = max(0, end - block)
+        f.seek(start)
+        lines = f.read(end - start).splitlines()[1 if start else 0:]
+        lines = [line for line in lines if line.strip()]
+        if lines:
+            return json.loads(lines[-1])["offset"]
+        if not start:
+            return 0
+        block *= 2
+
+
+def last_offset():
+    if not events_file.exists():
+        return 0
+    with open(events_file, "rb") as f:
+        return _last_offset(f)
+
+
+def record(changes):
+    # changes: (op, row) pairs in the order they were applied to the store
+    if not changes:
+        return
+    with open(events_file, "ab+") as f, statefile.locked(f):
+        # Drop a line torn by a crash, so new events start on a line of their own
+        end = _complete_end(f)
+        if end < f.seek(0, os.SEEK_END):
+            f.truncate(end)
+        offset = _last_offset(f)
+        timestamp = datetime.now(timezone.utc).isoformat()
+        lines = []
+        for op, row in changes:
+            offset += 1
+            event = {"offset": offset, "op": op, "ts": timestamp, "row": _clean(row)}
+            lines.append(json.dumps(event) + "\n")
+        f.seek(0, os.SEEK_END)
+        f.write("".join(lines).encode("utf-8"))
+
+
+def _line_start(f, position):
+    # Start of the first line beginning at or after position
+    if position:
+        f.seek(position - 1)
+        f.readline()
+    else:
+        f.seek(0)
+    return f.tell()
+
+
+def _seek_after(f, since):
+    # Binary search over byte positions for the first event with offset > since,
+    # so a pull reads O(log n) lines plus the batch itself
+    lo, hi = 0, f.seek(0, os.SEEK_END)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        _line_start(f, mid)
+        line = f.readline()
+        if line.endswith(b"\n") and json.loads(line)["offset"] <= since:
+            lo = mid + 1
+        else:
+            hi = mid
+    f.seek(_line_start(f, lo))
+
+
+def read_events(since=0, limit=DEFAULT_BATCH):
+    # Events with offset > since, oldest first, at most limit of them
+    if not events_file.exists():
+        return [], since
+    events = []
+    with open(events_file, "rb") as f:
+        _seek_after(f, since)
+        for line in f:
+            if len(events) >= limit:
+                break
+            if line.endswith(b"\n"):  # skip a line still being written
+                events.append(json.loads(line))
+    next_offset = events[-1]["offset"] if events else since
+    return events, next_offset
+
+
+class EventsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path != "/events":
+            self.send_error(404)
+            return
+        params = parse_qs(url.query)
+        try:
+            since = int(params.get("since", ["0"])[0])
+            limit = min(int(params.get("limit", [str(DEFAULT_BATCH)])[0]), 10 * DEFAULT_BATCH)
+        except ValueError:
+            self.send_error(400, "since and limit must be integers")
+            return
+
+        events, next_offset = read_events(since, limit)
+        body = json.dumps({"events": events, "next": next_offset}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pull HURS score change events by offset")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    pull = commands.add_parser("pull", help="print events after an offset as JSON lines")
+    pull.add_argument("--since", type=int, default=0, help="last offset already consumed")
+    pull.add_argument("--limit", type=int, default=DEFAULT_BATCH, help="maximum events to print")
+
+    serve = commands.add_parser("serve", help="serve GET /events?since=N&limit=M on localhost")
+    serve.add_argument("--port", type=int, default=8600)
+
+    args = parser.parse_args()
+    if args.command == "pull":
+        events, _ = read_events(args.since, args.limit)
+        for event in events:
+            print(json.dumps(event))
+    else:
+        server = ThreadingHTTPServer(("127.0.0.1", args.port), EventsHandler)
+        print(f"Serving score events on http://127.0.0.1:{args.port}/events")
+        server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+import argparse
+import csv
+import functools
+import hashlib
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pandas as pd
+
+import statefile
+import store
+from rubric import questions_data
+
+try:
+    from PIL import Image
+except ImportError:  # image thumbnails are skipped without Pillow
+    Image = None
+
+# Evidence files, stored once per content hash:
+# evidence/objects/ab/abcdef....  plus the item each upload was attached to
+evidence_dir = Path("evidence")
+objects_dir = evidence_dir / "objects"
+previews_dir = evidence_dir / "previews"
+index_file = evidence_dir / "attachments.csv"
+
+INDEX_COLUMNS = ["Round", "Institution", "Assessor", "Question", "Key Aspect", "Item", "Hash", "File Name", "Size", "Uploaded At"]
+
+# Uploads are hashed and written in pieces of this size
+CHUNK_SIZE = 1 << 20
+
+# Previews: longest thumbnail side in pixels, and leading bytes shown of text files
+THUMBNAIL_SIZE = 480
+TEXT_PREVIEW_BYTES = 4096
+
+TEXT_SUFFIXES = {".txt", ".csv", ".md", ".json", ".xml", ".html", ".htm"}
+IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp", ".tif", ".tiff"}
+
+
+def object_path(digest):
+    return objects_dir / digest[:2] / digest
+
+
+def store_blob(stream, chunk_size=CHUNK_SIZE):
+    # Copy a readable binary stream to the object store chunk by chunk,
+    # hashing as it goes. Content already stored is not written twice.
+    objects_dir.mkdir(parents=True, exist_ok=True)
+    digest = hashlib.sha256()
+    size = 0
+    tmp_file = objects_dir / f"upload.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_file, "wb") as f:
+            while chunk := stream.read(chunk_size):
+                digest.update(chunk)
+                f.write(chunk)
+                size += len(chunk)
+        digest = digest.hexdigest()
+        path = object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(exist_ok=True)
+            os.replace(tmp_file, path)
+    finally:
+        tmp_file.unlink(missing_ok=True)
+    return digest, size
+
+
+def _append_index(row):
+    evidence_dir.mkdir(exist_ok=True)
+    with open(index_file, "a", newline="", encoding="utf-8") as f, statefile.locked(f):
+        writer = csv.DictWriter(f, fieldnames=INDEX_COLUMNS)
+        if f.seek(0, os.SEEK_END) == 0:
+            writer.writeheader()
+        writer.writerow(row)
+
+
+def attach(stream, file_name, institution, assessor, question, aspect, item, round_=None):
+    # Store the upload and record which rubric item it is evidence for.
+    # Attaching the same file to the same item again records nothing new.
+    if item not in questions_data.get(question, {}).get("Key Aspects", {}).get(aspect, []):
+        raise ValueError(f"Unknown rubric item for {question} / {aspect}: {item}")
+    digest, size = store_blob(stream)
+    round_ = round_ or store.CURRENT_ROUND
+    existing = attachments(rounds=[round_], institutions=[institution], questions=[question])
+    if ((existing["Key Aspect"] == aspect) & (existing["Item"] == item) & (existing["Hash"] == digest)).any():
+        return digest, False
+    _append_index({
+        "Round": round_,
+        "Institution": institution,
+        "Assessor": assessor,
+        "Question": question,
+        "Key Aspect": aspect,
+        "Item": item,
+        "Hash": digest,
+        "File Name": file_name,
+        "Size": size,
+        "Uploaded At": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    })
+    return digest, True
+
+
+def attachments(rounds=None, institutions=None, questions=None):
+    if not index_file.exists():
+        return pd.DataFrame(columns=INDEX_COLUMNS)
+    frame = pd.read_csv(index_file, dtype=str, keep_default_na=False)
+    for column, values in [("Round", rounds), ("Institution", institutions), ("Question", questions)]:
+        if values:
+            frame = frame[frame[column].isin(values)]
+    return frame.reset_index(drop=True)
+
+
+def _thumbnail(digest):
+    preview_file = previews_dir / f"{digest}.png"
+    if not preview_file.exists():
+        previews_dir.mkdir(parents=True, exist_ok=True)
+        with Image.open(object_path(digest)) as image:
+            image.thumbnail((THUMBNAIL_SIZE, THUMBNAIL_SIZE))
+            thumbnail = image.convert("RGB")
+        statefile.write_atomic(preview_file, lambda tmp_file: thumbnail.save(tmp_file, format="PNG"))
+    return preview_file
+
+
+@functools.lru_cache(maxsize=128)
+def preview(digest, file_name):
+    # ("image", path to a PNG thumbnail), ("text", leading text) or (None, None).
+    # Made on first request only; thumbnails are also kept on disk, so
+    # other processes and restarts reuse them.
+    suffix = Path(file_name).suffix.lower()
+    if suffix in IMAGE_SUFFIXES and Image is not None:
+        try:
+            return "image", str(_thumbnail(digest))
+        except OSError:  # not an image Pillow can read
+            return None, None
+    if suffix in TEXT_SUFFIXES:
+        with open(object_path(digest), "rb") as f:
+            return "text", f.read(TEXT_PREVIEW_BYTES).decode("utf-8", errors="replace")
+    return None, None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Attach evidence files to HURS rubric items")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    add = commands.add_parser("attach", help="store a file as evidence for one rubric item")
+    add.add_argument("file")
+    add.add_argument("--institution", required=True)
+    add.add_argument("--assessor", required=True)
+    add.add_argument("--question", required=True)
+    add.add_argument("--aspect", required=True)
+    add.add_argument("--item", required=True)
+
+    show = commands.add_parser("list", help="list attachments")
+    show.add_argument("--institution", action="append", dest="institutions")
+    show.add_argument("--question", action="append", dest="questions")
+
+    args = parser.parse_args()
+    if args.command == "attach":
+        with open(args.file, "rb") as f:
+            digest, added = attach(
+                f, Path(args.file).name, args.institution, args.assessor, args.question, args.aspect, args.item
+            )
+        print(f"{digest} {'attached' if added else 'already attached'}")
+    else:
+        print(attachments(institutions=args.institutions, questions=args.questions).to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+import pyarrow as pa
+
+import archive
+import store
+
+
+def query_scores(rounds=None, columns=None, table=None, **filters):
+    # Live rows (of table, or the current snapshot) plus the archived
+    # partitions of the requested rounds; with no round selected every
+    # archived round is included
+    expression = store.filter_expression(rounds=rounds, **filters)
+    tables = [store.query_live(expression, columns, table)]
+    archived = archive.archived_rounds()
+    if rounds:
+        archived = [round_ for round_ in archived if round_ in rounds]
+    if archived:
+        tables.append(archive.read_history(columns=columns, expression=expression))
+    return pa.concat_tables(tables)
+
+
+def export_csv(table=None, **filters):
+    return store.export_csv(query_scores(table=table, **filters))
@@ -0,0 +1,185 @@
+import linecache
+import os
+import threading
+import time
+import tracemalloc
+from collections import OrderedDict
+
+import pandas as pd
+import pyarrow as pa
+
+import metrics
+
+# Off unless HURS_MEMDIAG is set: tracing every allocation slows the app
+# down noticeably. HURS_MEMDIAG_FRAMES > 1 records deeper tracebacks.
+ENABLED = os.environ.get("HURS_MEMDIAG", "") not in ("", "0")
+FRAMES = int(os.environ.get("HURS_MEMDIAG_FRAMES", 1))
+
+# Rows shown per table, and sessions remembered
+TOP = 25
+MAX_SESSIONS = 500
+
+metrics.HELP.update({
+    "hurs_traced_memory_bytes": "Python heap traced by tracemalloc",
+    "hurs_traced_memory_peak_bytes": "Peak Python heap traced by tracemalloc",
+    "hurs_arrow_allocated_bytes": "Bytes held by the Arrow memory pool",
+})
+
+_lock = threading.Lock()
+_phases = {}
+_sessions = OrderedDict()
+_caches = {}
+_snapshots = {"baseline": None, "previous": None}
+_current = threading.local()
+
+
+def enabled():
+    return tracemalloc.is_tracing()
+
+
+def traced():
+    # (current, peak) bytes of traced Python heap
+    return tracemalloc.get_traced_memory()
+
+
+def start():
+    # Once per process; the first snapshot is the baseline for growth
+    if not ENABLED or tracemalloc.is_tracing():
+        return
+    tracemalloc.start(FRAMES)
+    _snapshots["baseline"] = _snapshots["previous"] = _take()
+    metrics.add_collector("memdiag", _collect)
+
+
+def _collect():
+    current, peak = tracemalloc.get_traced_memory()
+    metrics.set_gauge("hurs_traced_memory_bytes", current)
+    metrics.set_gauge("hurs_traced_memory_peak_bytes", peak)
+    metrics.set_gauge("hurs_arrow_allocated_bytes", pa.total_allocated_bytes())
+
+
+def _take():
+    return tracemalloc.take_snapshot().filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, linecache.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+    ])
+
+
+def begin_rerun(session_id):
+    # Net heap change is attributed to the phase running in this thread.
+    # Sessions rerunning at the same time blur each other's numbers, so
+    # compare phases and sessions over many reruns.
+    if not tracemalloc.is_tracing():
+        return
+    now = tracemalloc.get_traced_memory()[0]
+    _current.session = session_id
+    _current.phase = None
+    _current.started = _current.marked = now
+
+
+def mark(phase):
+    # Close the running phase and start the next one (None ends the rerun)
+    if not tracemalloc.is_tracing() or getattr(_current, "session", None) is None:
+        return
+    now = tracemalloc.get_traced_memory()[0]
+    if _current.phase is not None:
+        delta = now - _current.marked
+        with _lock:
+            stats = _phases.setdefault(_current.phase, {"Runs": 0, "Net Bytes": 0, "Largest Growth": 0})
+            stats["Runs"] += 1
+            stats["Net Bytes"] += delta
+            stats["Largest Growth"] = max(stats["Largest Growth"], delta)
+    _current.phase = phase
+    _current.marked = now
+
+
+def end_rerun():
+    if not tracemalloc.is_tracing() or getattr(_current, "session", None) is None:
+        return
+    mark(None)
+    delta = tracemalloc.get_traced_memory()[0] - _current.started
+    with _lock:
+        stats = _sessions.pop(_current.session, {"Reruns": 0, "Net Bytes": 0})
+        stats["Reruns"] += 1
+        stats["Net Bytes"] += delta
+        stats["Last Seen"] = time.time()
+        _sessions[_current.session] = stats
+        while len(_sessions) > MAX_SESSIONS:
+            _sessions.popitem(last=False)
+    _current.session = None
+
+
+def note_entry(cache, key, nbytes, max_entries):
+    # Record the size of a value stored in a cache we cannot inspect, such
+    # as st.cache_data, keeping only as many entries as the cache holds
+    if not tracemalloc.is_tracing():
+        return
+    with _lock:
+        entries = _caches.setdefault(cache, OrderedDict())
+        entries.pop(key, None)
+        entries[key] = nbytes
+        while len(entries) > max_entries:
+            entries.popitem(last=False)
+
+
+def add_cache(cache, size):
+    # size() returns (entries, bytes) for a cache that can report itself
+    _caches[cache] = size
+
+
+def phase_frame():
+    with _lock:
+        frame = pd.DataFrame([{"Phase": name, **stats} for name, stats in _phases.items()])
+    if frame.empty:
+        return frame
+    frame["Mean Net Bytes"] = frame["Net Bytes"] / frame["Runs"]
+    return frame.sort_values("Net Bytes", ascending=False).reset_index(drop=True)
+
+
+def session_frame():
+    with _lock:
+        frame = pd.DataFrame([{"Session": session_id, **stats} for session_id, stats in _sessions.items()])
+    if frame.empty:
+        return frame
+    frame["Last Seen"] = pd.to_datetime(frame["Last Seen"], unit="s")
+    return frame.sort_values("Net Bytes", ascending=False).head(TOP).reset_index(drop=True)
+
+
+def cache_frame():
+    records = []
+    with _lock:
+        caches = list(_caches.items())
+    for cache, entries in caches:
+        if callable(entries):
+            count, nbytes = entries()
+        else:
+            count, nbytes = len(entries), sum(entries.values())
+        records.append({"Cache": cache, "Entries": count, "Bytes": nbytes})
+    records.append({"Cache": "Arrow memory pool", "Entries": None, "Bytes": pa.total_allocated_bytes()})
+    return pd.DataFrame(records).astype({"Entries": "Int64"})
+
+
+def growth(since="baseline", key_type="lineno"):
+    # Top allocation sites by growth since the baseline or the previous
+    # call; every call becomes the next "previous" snapshot
+    snapshot = _take()
+    reference = _snapshots[since] or snapshot
+    with _lock:
+        _snapshots["previous"] = snapshot
+    records = [
+        {
+            "Site": str(stat.traceback[0]) if key_type == "lineno" else stat.traceback[0].filename,
+            "Growth Bytes": stat.size_diff,
+            "Bytes": stat.size,
+            "Growth Blocks": stat.count_diff,
+        }
+        for stat in snapshot.compare_to(reference, key_type)[:TOP]
+    ]
+    return pd.DataFrame(records)
+
+
+def reset_baseline():
+    with _lock:
+        _snapshots["baseline"] = _snapshots["previous"] = _take()
+        _phases.clear()
@@ -0,0 +1,168 @@
+import argparse
+import csv
+import heapq
+import itertools
+import os
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+from rubric import questions_data
+from store import COLUMNS, CURRENT_ROUND, KEY
+
+# Rows sorted in memory at a time before spilling a run to disk
+RUN_ROWS = 100_000
+
+# Most runs opened at once by one merge pass
+MAX_FANIN = 256
+
+RUN_COLUMNS = COLUMNS + ["Source", "Row"]
+
+
+def _score(row):
+    try:
+        return float(row["Score"])
+    except (TypeError, ValueError):
+        return float("-inf")
+
+
+# Conflict policies: pick one row out of all rows sharing a key
+POLICIES = {
+    # Most recent save; ties go to the file listed last, then to the later
+    # row within a file
+    "latest": lambda rows: max(rows, key=lambda row: (row["Saved At"], int(row["Source"]), int(row["Row"]))),
+    "highest": lambda rows: max(rows, key=_score),
+    "lowest": lambda rows: min(rows, key=_score),
+}
+
+
+def _sort_key(row):
+    return tuple(row[column] for column in KEY)
+
+
+def _write_run(rows, run_dir, runs):
+    path = Path(run_dir) / f"run-{len(runs)}.csv"
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, RUN_COLUMNS)
+        writer.writeheader()
+        writer.writerows(sorted(rows, key=_sort_key))
+    runs.append(path)
+
+
+def _read_run(path):
+    with open(path, newline="") as f:
+        yield from csv.DictReader(f)
+
+
+def _legacy_item(row, positions, path, number):
+    # Files from before scores were kept per item list one row per item of
+    # each key aspect, in rubric order, once per save of the question
+    items = questions_data.get(row["Question"], {}).get("Key Aspects", {}).get(row["Key Aspect"])
+    if not items:
+        raise ValueError(
+            f"{path}, row {number}: no Item column and {row['Question']!r} / {row['Key Aspect']!r} "
+            "is not in the rubric, so the item cannot be identified"
+        )
+    group = tuple(row[column] for column in KEY if column != "Item")
+    position = positions.get(group, 0)
+    positions[group] = position + 1
+    return items[position % len(items)]
+
+
+def split_runs(inputs, run_dir, run_rows=RUN_ROWS, round_=CURRENT_ROUND, institution=None):
+    # Stream every input into sorted runs of at most run_rows rows. Files from
+    # older versions of the app lack some columns, so their rows are keyed by
+    # (round_, institution, Assessor, Question, Key Aspect, rubric item):
+    # rows without a save time take the file's modification time, and files
+    # without an Item column are matched to the rubric by position.
+    runs = []
+    for source, path in enumerate(inputs):
+        modified = datetime.fromtimestamp(os.path.getmtime(path), timezone.utc).isoformat(timespec="seconds")
+        rows = []
+        positions = {}
+        with open(path, newline="") as f:
+            reader = csv.DictReader(f)
+            has_item = "Item" in (reader.fieldnames or [])
+            for number, row in enumerate(reader, start=1):
+                row = {column: row.get(column) or "" for column in COLUMNS}
+                row["Round"] = row["Round"] or round_
+                row["Institution"] = row["Institution"] or institution or ""
+                if not row["Institution"]:
+                    raise ValueError(f"{path}, row {number}: no Institution; pass --institution for legacy files")
+                if not has_item:
+                    row["Item"] = _legacy_item(row, positions, path, number)
+                row["Saved At"] = row["Saved At"] or modified
+                row["Source"] = str(source)
+                row["Row"] = str(number)
+                rows.append(row)
+                if len(rows) >= run_rows:
+                    _write_run(rows, run_dir, runs)
+                    rows = []
+        if rows:
+            _write_run(rows, run_dir, runs)
+    return runs
+
+
+def _merge_pass(runs, run_dir):
+    # Reduce the number of runs so the final merge stays under MAX_FANIN open files
+    merged = []
+    for start in range(0, len(runs), MAX_FANIN):
+        group = runs[start:start + MAX_FANIN]
+        path = Path(run_dir) / f"pass-{len(runs)}-{start}.csv"
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, RUN_COLUMNS)
+            writer.writeheader()
+            writer.writerows(heapq.merge(*(_read_run(run) for run in group), key=_sort_key))
+        for run in group:
+            os.remove(run)
+        merged.append(path)
+    return merged
+
+
+def merge_files(inputs, output, policy="latest", run_rows=RUN_ROWS, round_=CURRENT_ROUND, institution=None):
+    choose = POLICIES[policy]
+    summary = {"rows": 0, "keys": 0, "conflicts": 0}
+    with tempfile.TemporaryDirectory(dir=Path(output).parent) as run_dir:
+        runs = split_runs(inputs, run_dir, run_rows, round_, institution)
+        while len(runs) > MAX_FANIN:
+            runs = _merge_pass(runs, run_dir)
+
+        tmp_output = Path(run_dir) / "merged.csv"
+        with open(tmp_output, "w", newline="") as f:
+            writer = csv.DictWriter(f, COLUMNS, extrasaction="ignore")
+            writer.writeheader()
+            merged = heapq.merge(*(_read_run(run) for run in runs), key=_sort_key)
+            for _, group in itertools.groupby(merged, key=_sort_key):
+                rows = list(group)
+                summary["rows"] += len(rows)
+                summary["keys"] += 1
+                if len(rows) > 1 and len({(row["Score"], row["Comments"]) for row in rows}) > 1:
+                    summary["conflicts"] += 1
+                writer.writerow(choose(rows))
+        os.replace(tmp_output, output)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Merge offline HURS score files into one consolidated store")
+    parser.add_argument("inputs", nargs="+", help="scores.csv files exported by offline copies of the app")
+    parser.add_argument("-o", "--output", default="merged_scores.csv", help="consolidated CSV to write")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="latest", help="how to resolve conflicting scores")
+    parser.add_argument("--run-rows", type=int, default=RUN_ROWS, help="rows sorted in memory at a time")
+    parser.add_argument("--round", default=CURRENT_ROUND,
+                        help="round for rows that have none, e.g. from older app versions (default: %(default)s)")
+    parser.add_argument("--institution", help="institution for rows that have none; required for such files")
+    args = parser.parse_args()
+
+    try:
+        summary = merge_files(args.inputs, args.output, args.policy, args.run_rows, args.round, args.institution)
+    except ValueError as error:
+        parser.exit(1, f"merge_scores: {error}\n")
+    print(
+        f"Merged {summary['rows']} rows from {len(args.inputs)} files into {summary['keys']} scores "
+        f"({summary['conflicts']} conflicts resolved by {args.policy}) -> {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    main()
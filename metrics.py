@@ -0,0 +1,170 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import statefile
+
+# Prometheus text exposition, written after every rerun and optionally served
+# on HURS_METRICS_PORT for scraping
+metrics_file = Path(os.environ.get("HURS_METRICS_FILE", "metrics.prom"))
+
+# Interface /metrics and /ready listen on; 0.0.0.0 lets load balancers and
+# kubelet probes reach them
+DEFAULT_HOST = os.environ.get("HURS_METRICS_HOST", "127.0.0.1")
+
+# Seconds; covers quick cached reruns up to slow saves of large stores
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+# A session counts as active if it reran within this many seconds
+SESSION_WINDOW = 300
+
+HELP = {
+    "hurs_reruns_total": "Streamlit script reruns",
+    "hurs_rerun_seconds": "Wall time of a full script rerun",
+    "hurs_save_seconds": "Time to save one question's scores to the store",
+    "hurs_store_rows": "Rows in the live score store",
+    "hurs_store_bytes": "Size of scores.csv in bytes",
+    "hurs_convert_df_to_csv_calls_total": "Calls to convert_df_to_csv",
+    "hurs_convert_df_to_csv_misses_total": "convert_df_to_csv calls not served from st.cache_data",
+    "hurs_active_sessions": f"Sessions that reran in the last {SESSION_WINDOW} seconds",
+    "hurs_plotly_render_seconds": "Time to build and send one Plotly chart",
+}
+
+# Metrics live for the whole process, shared by all sessions
+_lock = threading.Lock()
+_counters = {}
+_gauges = {}
+_histograms = {}
+_sessions = {}
+_collectors = {}
+_readiness = None
+_server = None
+
+
+def _labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in sorted(labels.items())) + "}"
+
+
+def inc(name, amount=1, **labels):
+    with _lock:
+        key = (name, _labels(labels))
+        _counters[key] = _counters.get(key, 0) + amount
+
+
+def set_gauge(name, value, **labels):
+    with _lock:
+        _gauges[(name, _labels(labels))] = value
+
+
+def observe(name, value, buckets=DEFAULT_BUCKETS):
+    with _lock:
+        histogram = _histograms.setdefault(name, {"buckets": buckets, "counts": [0] * len(buckets), "sum": 0.0, "count": 0})
+        for i, bound in enumerate(histogram["buckets"]):
+            if value <= bound:
+                histogram["counts"][i] += 1
+        histogram["sum"] += value
+        histogram["count"] += 1
+
+
+@contextmanager
+def timer(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - start)
+
+
+def touch_session(session_id):
+    with _lock:
+        _sessions[session_id] = time.monotonic()
+
+
+def add_collector(name, collect):
+    # Called at render time, for gauges that are cheap to read on demand
+    _collectors[name] = collect
+
+
+def set_readiness_check(check):
+    # check() returns None when ready, else why not; GET /ready answers 200
+    # or 503 with the reason
+    global _readiness
+    _readiness = check
+
+
+def render():
+    for collect in list(_collectors.values()):
+        collect()
+
+    now = time.monotonic()
+    with _lock:
+        for session_id, seen in list(_sessions.items()):
+            if now - seen > SESSION_WINDOW:
+                del _sessions[session_id]
+        _gauges[("hurs_active_sessions", "")] = len(_sessions)
+
+        lines = []
+        for kind, samples in [("counter", _counters), ("gauge", _gauges)]:
+            for name in sorted({name for name, _ in samples}):
+                if name in HELP:
+                    lines.append(f"# HELP {name} {HELP[name]}")
+                lines.append(f"# TYPE {name} {kind}")
+                for (sample_name, labels), value in sorted(samples.items()):
+                    if sample_name == name:
+                        lines.append(f"{name}{labels} {value}")
+        for name, histogram in sorted(_histograms.items()):
+            if name in HELP:
+                lines.append(f"# HELP {name} {HELP[name]}")
+            lines.append(f"# TYPE {name} histogram")
+            for bound, count in zip(histogram["buckets"], histogram["counts"]):
+                lines.append(f'{name}_bucket{{le="{bound}"}} {count}')
+            lines.append(f'{name}_bucket{{le="+Inf"}} {histogram["count"]}')
+            lines.append(f"{name}_sum {histogram['sum']}")
+            lines.append(f"{name}_count {histogram['count']}")
+    return "\n".join(lines) + "\n"
+
+
+def write_textfile():
+    statefile.write_text(metrics_file, render())
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == "/ready":
+            reason = _readiness() if _readiness is not None else None
+            body = f"{reason or 'ready'}\n".encode("utf-8")
+            self.send_response(503 if reason else 200)
+        elif self.path == "/metrics":
+            body = render().encode("utf-8")
+            self.send_response(200)
+        else:
+            self.send_error(404)
+            return
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(port, host=DEFAULT_HOST):
+    # Start the /metrics and /ready endpoint once per process
+    global _server
+    with _lock:
+        if _server is not None:
+            return
+        _server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=_server.serve_forever, daemon=True).start()
+
+
+def serve_from_env():
+    port = os.environ.get("HURS_METRICS_PORT")
+    if port:
+        serve(int(port), os.environ.get("HURS_METRICS_HOST", DEFAULT_HOST))
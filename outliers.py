@@ -0,0 +1,73 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+
+# Iglewicz and Hoaglin's cut-off for the modified z-score
+Z_THRESHOLD = 3.5
+
+# The same rubric item scored for the same institution
+CELL = ["Institution", "Question", "Key Aspect", "Item"]
+
+
+def residuals(frame):
+    # Each score minus the leave-one-out mean of the other assessors on the
+    # same cell; cells scored by a single assessor have no consensus
+    frame = frame.dropna(subset=["Institution", "Score"]).assign(Item=frame["Item"].fillna(""))
+    grouped = frame.groupby(CELL, sort=False)["Score"]
+    totals = grouped.transform("sum")
+    counts = grouped.transform("count")
+    frame = frame[counts > 1]
+    consensus = (totals[counts > 1] - frame["Score"]) / (counts[counts > 1] - 1)
+    return frame.assign(Residual=frame["Score"] - consensus)
+
+
+def robust_z(matrix):
+    # Modified z-score per column: 0.6745 * (x - median) / MAD, ignoring gaps.
+    # A column with no spread gets 0 rather than infinity.
+    with warnings.catch_warnings(), np.errstate(invalid="ignore", divide="ignore"):
+        warnings.simplefilter("ignore", RuntimeWarning)  # all-empty columns
+        median = np.nanmedian(matrix, axis=0)
+        mad = np.nanmedian(np.abs(matrix - median), axis=0)
+        z = 0.6745 * (matrix - median) / mad
+    return np.where(mad > 0, z, 0.0)
+
+
+def assessor_bias(frame):
+    # Pivot residuals to (assessor x item) and (assessor x indicator) and
+    # score every assessor against the others column by column
+    scored = residuals(frame)
+    if scored.empty:
+        return pd.DataFrame(), pd.DataFrame()
+    item_keys = scored["Question"] + " | " + scored["Key Aspect"] + " | " + scored["Item"]
+    by_item = scored.assign(ItemKey=item_keys).pivot_table(
+        index="Assessor", columns="ItemKey", values="Residual", aggfunc="mean"
+    )
+    by_indicator = scored.pivot_table(index="Assessor", columns="Question", values="Residual", aggfunc="mean")
+
+    item_values = by_item.to_numpy()
+    mean_residual = np.nanmean(item_values, axis=1)
+    overall_z = robust_z(mean_residual[:, None])[:, 0]
+    item_z = robust_z(item_values)
+    summary = pd.DataFrame({
+        "Assessor": by_item.index,
+        "Items Compared": np.sum(~np.isnan(item_values), axis=1),
+        "Mean Residual": mean_residual,
+        "Robust Z": overall_z,
+        "Outlying Items": np.sum(np.abs(item_z) > Z_THRESHOLD, axis=1),
+    })
+    # Residuals that cancel out to (floating-point) zero lean neither way
+    residual = summary["Mean Residual"].to_numpy()
+    neutral = np.isclose(residual, 0.0, atol=1e-9)
+    summary["Tendency"] = np.select([neutral, residual > 0], ["Neutral", "Lenient"], "Harsh")
+    summary["Flagged"] = np.abs(summary["Robust Z"]) > Z_THRESHOLD
+    summary = summary.sort_values("Robust Z", key=np.abs, ascending=False).reset_index(drop=True)
+
+    indicator_z = pd.DataFrame(robust_z(by_indicator.to_numpy()), index=by_indicator.index, columns=by_indicator.columns)
+    flagged = pd.concat(
+        {"Mean Residual": by_indicator.stack(), "Robust Z": indicator_z.stack()}, axis=1
+    ).reset_index()
+    flagged = flagged[np.abs(flagged["Robust Z"]) > Z_THRESHOLD]
+    flagged = flagged.rename(columns={"Question": "Indicator"})
+    flagged = flagged.sort_values("Robust Z", key=np.abs, ascending=False).reset_index(drop=True)
+    return summary, flagged
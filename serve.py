@@ -0,0 +1,39 @@
+import argparse
+import os
+import sys
+from pathlib import Path
+
+from streamlit.web import cli as streamlit_cli
+
+import memdiag
+import metrics
+import warmup
+
+APP = Path(__file__).with_name("app.py")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Start the HURS app with warm caches; extra arguments are passed to `streamlit run`"
+    )
+    parser.add_argument("--health-port", type=int, default=int(os.environ.get("HURS_METRICS_PORT", 8601)),
+                        help="port for GET /ready and GET /metrics")
+    parser.add_argument("--health-host", default=metrics.DEFAULT_HOST,
+                        help="interface for the health port; 0.0.0.0 for load balancers and probes")
+    args, streamlit_args = parser.parse_known_args()
+
+    # Same process as the Streamlit server, so the app's sessions reuse
+    # everything the warm-up loads. /ready stays 503 until it succeeds.
+    os.environ["HURS_METRICS_PORT"] = str(args.health_port)
+    os.environ["HURS_METRICS_HOST"] = args.health_host
+    memdiag.start()  # before the warm-up, so growth sites include what it loads
+    metrics.set_readiness_check(warmup.not_ready)
+    metrics.serve(args.health_port, args.health_host)
+    warmup.start()
+
+    sys.argv = ["streamlit", "run", str(APP), *streamlit_args]
+    sys.exit(streamlit_cli.main())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+import json
+import os
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: single writer process assumed
+    fcntl = None
+
+# Schema metadata key holding the data version a score table was read from
+SOURCE_VERSION = "source_version"
+
+
+def table_version(table):
+    metadata = table.schema.metadata or {}
+    return metadata.get(SOURCE_VERSION.encode(), b"").decode() or None
+
+
+def write_atomic(path, write):
+    # write(tmp_path) next to path, then swap it in, so readers see either
+    # the old file or the new one and never a partial write
+    tmp_file = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        write(tmp_file)
+        os.replace(tmp_file, path)
+    finally:
+        tmp_file.unlink(missing_ok=True)
+
+
+def write_text(path, text):
+    write_atomic(path, lambda tmp_file: tmp_file.write_text(text))
+
+
+@contextmanager
+def locked(f):
+    # Exclusive lock on an open file, shared with other processes
+    if fcntl:
+        fcntl.flock(f, fcntl.LOCK_EX)
+    try:
+        yield f
+    finally:
+        if fcntl:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class VersionedState:
+    # JSON state derived from the score store and saved with the data version
+    # it matches. Loaded once per version and shared by every session of the
+    # process; saves fold their rows in through apply().
+
+    def __init__(self, path, dump, load):
+        self.path = path
+        self.dump = dump
+        self.load = load
+        self.lock = threading.Lock()
+        self.memo = None
+
+    def read(self):
+        # (version, state), or (None, None) when missing or unreadable
+        if not self.path.exists():
+            return None, None
+        try:
+            payload = json.loads(self.path.read_text())
+            return payload["version"], self.load(payload["state"])
+        except (ValueError, KeyError, TypeError):
+            return None, None
+
+    def write(self, version, state):
+        write_text(self.path, json.dumps({"version": version, "state": self.dump(state)}))
+
+    def get(self, table, build):
+        # The saved state when it matches the version table was read from,
+        # else build(table, saved state or None). The result is only ever
+        # saved under the table's own version, so a table loaded before a
+        # save never passes for the store after it.
+        version = table_version(table)
+        memo = self.memo
+        if memo is not None and memo[0] == version:
+            return memo[1]
+
+        with self.lock:
+            if self.memo is None or self.memo[0] != version:
+                saved_version, state = self.read()
+                if version is None or saved_version != version:
+                    state = build(table, state)
+                    if version is not None:
+                        self.write(version, state)
+                self.memo = (version, state)
+            return self.memo[1]
+
+    def apply(self, before, after, update):
+        # Move the saved state from before to after with update(state). If it
+        # does not match the store as it was before the change, leave it for
+        # get() to rebuild.
+        with self.lock:
+            saved_version, state = self.read()
+            if saved_version != before:
+                return
+            state = update(state)
+            self.write(after, state)
+            self.memo = (after, state)
+
+    def replace(self, update):
+        # Change the saved state without moving its version
+        with self.lock:
+            saved_version, state = self.read()
+            if saved_version is None:
+                return
+            self.write(saved_version, update(state))
+            self.memo = None
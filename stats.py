@@ -0,0 +1,180 @@
+import math
+from pathlib import Path
+
+import pandas as pd
+
+import statefile
+
+# Running statistics per indicator, key aspect and item, kept in step with scores.csv
+stats_file = Path("score_stats.json")
+
+# z value for the 95% confidence intervals
+Z_95 = 1.959964
+
+
+class RunningStats:
+    # Welford accumulator plus value counts, so the median of the (discrete)
+    # scores stays exact without keeping every observation
+
+    def __init__(self, n=0, mean=0.0, m2=0.0, counts=None):
+        self.n = n
+        self.mean = mean
+        self.m2 = m2
+        self.counts = dict(counts or {})
+
+    def add(self, x):
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+        self.counts[x] = self.counts.get(x, 0) + 1
+
+    def remove(self, x):
+        if self.n <= 1:
+            self.n, self.mean, self.m2, self.counts = 0, 0.0, 0.0, {}
+            return
+        old_mean = self.mean
+        self.n -= 1
+        self.mean = (old_mean * (self.n + 1) - x) / self.n
+        self.m2 = max(self.m2 - (x - old_mean) * (x - self.mean), 0.0)
+        self.counts[x] -= 1
+        if not self.counts[x]:
+            del self.counts[x]
+
+    @property
+    def std(self):
+        return math.sqrt(self.m2 / (self.n - 1)) if self.n > 1 else 0.0
+
+    @property
+    def median(self):
+        if not self.n:
+            return math.nan
+        values = sorted(self.counts)
+        lower_rank, upper_rank = (self.n - 1) // 2, self.n // 2
+        lower = upper = None
+        seen = 0
+        for value in values:
+            seen += self.counts[value]
+            if lower is None and seen > lower_rank:
+                lower = value
+            if seen > upper_rank:
+                upper = value
+                break
+        return (lower + upper) / 2
+
+    @property
+    def ones(self):
+        return self.counts.get(1.0, 0) / self.n if self.n else math.nan
+
+    @property
+    def ci(self):
+        if not self.n:
+            return math.nan, math.nan
+        half_width = Z_95 * self.std / math.sqrt(self.n)
+        return self.mean - half_width, self.mean + half_width
+
+    def to_json(self):
+        return [self.n, self.mean, self.m2, [[v, c] for v, c in self.counts.items()]]
+
+    @classmethod
+    def from_json(cls, data):
+        n, mean, m2, counts = data
+        return cls(n, mean, m2, {v: c for v, c in counts})
+
+
+def _group_keys(question, aspect, item):
+    # One accumulator per indicator, per key aspect and per item
+    keys = [(question, None, None), (question, aspect, None)]
+    if item:
+        keys.append((question, aspect, item))
+    return keys
+
+
+def _build(frame):
+    groups = {}
+    frame = frame.dropna(subset=["Score"]).assign(Item=frame["Item"].fillna(""))
+    levels = [["Question"], ["Question", "Key Aspect"], ["Question", "Key Aspect", "Item"]]
+    for keys in levels:
+        level_frame = frame[frame["Item"] != ""] if "Item" in keys else frame
+        if level_frame.empty:
+            continue
+        agg = level_frame.groupby(keys)["Score"].agg(["count", "mean", "var"])
+        counts = level_frame.groupby(keys + ["Score"]).size()
+        for group, row in agg.iterrows():
+            group = group if isinstance(group, tuple) else (group,)
+            key = tuple(group) + (None,) * (3 - len(group))
+            m2 = 0.0 if pd.isna(row["var"]) else row["var"] * (row["count"] - 1)
+            groups[key] = RunningStats(int(row["count"]), float(row["mean"]), float(m2))
+        for group, count in counts.items():
+            key = tuple(group[:-1]) + (None,) * (4 - len(group))
+            groups[key].counts[float(group[-1])] = int(count)
+    return groups
+
+
+def _dump(groups):
+    return [[list(key), acc.to_json()] for key, acc in groups.items()]
+
+
+def _load(payload):
+    return {tuple(key): RunningStats.from_json(acc) for key, acc in payload}
+
+
+_state = statefile.VersionedState(stats_file, _dump, _load)
+
+
+def _rebuild(table, saved):
+    return _build(table.select(["Question", "Key Aspect", "Item", "Score"]).to_pandas())
+
+
+def load_stats(table):
+    # Reuse the saved state when it matches the store; rebuild it otherwise
+    return _state.get(table, _rebuild)
+
+
+def apply_rows(rows, before, after, removed=None):
+    # Fold saved rows (and the rows they replaced or deleted) into the saved
+    # state. If the state does not match the store as it was before the
+    # save, leave it for load_stats to rebuild.
+    def update(groups):
+        for frame, method in [(removed, "remove"), (rows, "add")]:
+            if frame is None:
+                continue
+            for question, aspect, item, score in zip(
+                frame["Question"], frame["Key Aspect"], frame["Item"], frame["Score"]
+            ):
+                if pd.isna(score):
+                    continue
+                item = "" if pd.isna(item) else item
+                for key in _group_keys(question, aspect, item):
+                    getattr(groups.setdefault(key, RunningStats()), method)(float(score))
+        return {key: acc for key, acc in groups.items() if acc.n}
+
+    _state.apply(before, after, update)
+
+
+def summary_frame(groups, question):
+    records = []
+    for (q, aspect, item), acc in groups.items():
+        if q != question:
+            continue
+        level = "Item" if item else "Key Aspect" if aspect else "Indicator"
+        ci_low, ci_high = acc.ci
+        records.append({
+            "Level": level,
+            "Key Aspect": aspect or "",
+            "Item": item or "",
+            "Count": acc.n,
+            "Mean": acc.mean,
+            "Median": acc.median,
+            "Std": acc.std,
+            "Proportion of 1s": acc.ones,
+            "95% CI Low": ci_low,
+            "95% CI High": ci_high,
+        })
+    frame = pd.DataFrame(records)
+    if frame.empty:
+        return frame
+    # Indicator first, then each key aspect followed by its items
+    frame["order"] = frame["Level"].map({"Indicator": 0, "Key Aspect": 1, "Item": 2})
+    frame = frame.sort_values(["Key Aspect", "order", "Item"]).drop(columns="order")
+    return frame.reset_index(drop=True)
@@ -0,0 +1,299 @@
+import functools
+import operator
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.dataset as ds
+
+import changefeed
+import statefile
+import stats
+import trends
+
+# Path to save scores
+data_file = Path("scores.csv")
+
+# Columnar copy of scores.csv, memory-mapped read-only by every session and process
+snapshot_file = Path("scores.arrow")
+
+# Assessment round that new scores are saved under
+CURRENT_ROUND = os.environ.get("HURS_ROUND", str(datetime.now().year))
+
+COLUMNS = ["Round", "Institution", "Assessor", "Question", "Key Aspect", "Item", "Score", "Comments", "Saved At"]
+
+# A row is one assessor's score for one rubric item of one institution in one round
+KEY = ["Round", "Institution", "Assessor", "Question", "Key Aspect", "Item"]
+
+SCHEMA = pa.schema([
+    ("Round", pa.string()),
+    ("Institution", pa.string()),
+    ("Assessor", pa.string()),
+    ("Question", pa.string()),
+    ("Key Aspect", pa.string()),
+    ("Item", pa.string()),
+    ("Score", pa.float64()),
+    ("Comments", pa.string()),
+    ("Saved At", pa.string()),
+])
+
+# Held while writing scores.csv, so the app, the API server and the CLI
+# tools never interleave a read-modify-write
+lock_file = Path("scores.csv.lock")
+
+# Snapshot currently mapped by this process, shared by all of its sessions
+_snapshot = None
+_snapshot_lock = threading.Lock()
+_write_lock = threading.RLock()
+_write_lock_handle = None
+
+
+def init_store():
+    if not data_file.exists():
+        pd.DataFrame(columns=COLUMNS).to_csv(data_file, index=False)
+        return
+
+    # Files written before a column was added get the new header once, so
+    # later appends line up with it
+    with open(data_file, newline="") as f:
+        header = f.readline().strip()
+    if header != ",".join(COLUMNS):
+        pd.read_csv(data_file).reindex(columns=COLUMNS).to_csv(data_file, index=False)
+
+
+@contextmanager
+def write_lock():
+    # Re-entrant within a thread; the file lock is taken by the outermost holder
+    global _write_lock_handle
+    with _write_lock:
+        outermost = _write_lock_handle is None
+        if outermost:
+            _write_lock_handle = open(lock_file, "a")
+        try:
+            if outermost:
+                with statefile.locked(_write_lock_handle):
+                    yield
+            else:
+                yield
+        finally:
+            if outermost:
+                _write_lock_handle.close()
+                _write_lock_handle = None
+
+
+def data_version():
+    # Changes whenever scores.csv is rewritten or appended to
+    stat = data_file.stat()
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def read_csv_table(path):
+    table = pacsv.read_csv(
+        path,
+        read_options=pacsv.ReadOptions(use_threads=True),
+        # Comments may contain line breaks, written as quoted multi-line fields
+        parse_options=pacsv.ParseOptions(newlines_in_values=True),
+        convert_options=pacsv.ConvertOptions(
+            column_types=SCHEMA,
+            include_columns=COLUMNS,
+            include_missing_columns=True,
+        ),
+    )
+    return table.cast(SCHEMA)
+
+
+def table_version(table):
+    # Data version of scores.csv that a table from load_scores() was read
+    # from. Results derived from the table are keyed by this, not by
+    # data_version(), which may already have moved on.
+    return statefile.table_version(table)
+
+
+def rebuild_snapshot():
+    # Callers hold write_lock(), so scores.csv cannot change between reading
+    # its version and its rows
+    version = data_version()
+    table = read_csv_table(data_file)
+    table = table.replace_schema_metadata({statefile.SOURCE_VERSION: version})
+
+    def write(tmp_file):
+        with pa.OSFile(str(tmp_file), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+    # Swapped in whole; sessions still mapping the old inode keep reading it
+    # until they pick up the new version
+    statefile.write_atomic(snapshot_file, write)
+    return version
+
+
+def _snapshot_version():
+    if not snapshot_file.exists():
+        return None
+    with pa.memory_map(str(snapshot_file), "r") as source:
+        metadata = pa.ipc.open_file(source).schema.metadata or {}
+    return metadata.get(statefile.SOURCE_VERSION.encode(), b"").decode() or None
+
+
+def _map_snapshot():
+    # Zero-copy: column buffers point straight into the mapped file
+    source = pa.memory_map(str(snapshot_file), "r")
+    return pa.ipc.open_file(source).read_all()
+
+
+def load_scores():
+    global _snapshot
+    init_store()
+    version = data_version()
+    if _snapshot is not None and _snapshot[0] == version:
+        return _snapshot[1]
+
+    if _snapshot_version() != version:
+        # Changed outside save_scores, e.g. edited by hand; rebuild once no
+        # writer is halfway through a save
+        with write_lock():
+            if _snapshot_version() != data_version():
+                with _snapshot_lock:
+                    rebuild_snapshot()
+
+    with _snapshot_lock:
+        table = _map_snapshot()
+        _snapshot = (table_version(table), table)
+        return table
+
+
+def _write_all(frame):
+    statefile.write_atomic(data_file, lambda tmp_file: frame.to_csv(tmp_file, index=False))
+
+
+def _existing(rows):
+    # Stored rows sharing a key with rows; only the questions involved are
+    # converted to pandas
+    table = load_scores()
+    questions = pa.array(rows["Question"].dropna().unique(), pa.string())
+    candidates = table.filter(pc.is_in(table["Question"], questions)).to_pandas()
+    return candidates.merge(rows[KEY].drop_duplicates(), on=KEY)
+
+
+def key_mask(frame, rows):
+    return frame.set_index(KEY).index.isin(rows.set_index(KEY).index)
+
+
+def _commit(rows, removed, changes):
+    before = data_version()
+    if removed.empty:
+        rows.to_csv(data_file, mode="a", header=False, index=False)
+    else:
+        frame = load_scores().to_pandas()
+        frame = frame[~key_mask(frame, removed)]
+        _write_all(pd.concat([frame, rows], ignore_index=True))
+    with _snapshot_lock:
+        after = rebuild_snapshot()
+    stats.apply_rows(rows, before, after, removed=removed)
+    trends.apply_rows(rows, before, after, removed=removed)
+    changefeed.record(changes)
+
+
+def save_scores(rows):
+    # New keys are appended; keys already in the store replace the earlier
+    # scores, e.g. when an assessor saves a question again
+    init_store()
+    rows = rows.reindex(columns=COLUMNS).drop_duplicates(subset=KEY, keep="last")
+    rows["Round"] = rows["Round"].fillna(CURRENT_ROUND)
+    rows["Saved At"] = rows["Saved At"].fillna(datetime.now(timezone.utc).isoformat(timespec="seconds"))
+    with write_lock():
+        removed = _existing(rows)
+        updated = key_mask(rows, removed) if not removed.empty else [False] * len(rows)
+        changes = [
+            ("update" if is_update else "insert", row)
+            for is_update, row in zip(updated, rows.to_dict("records"))
+        ]
+        _commit(rows, removed, changes)
+
+
+def delete_scores(keys):
+    init_store()
+    keys = keys.reindex(columns=KEY)
+    keys["Round"] = keys["Round"].fillna(CURRENT_ROUND)
+    with write_lock():
+        removed = _existing(keys)
+        if not removed.empty:
+            _commit(pd.DataFrame(columns=COLUMNS), removed, [("delete", row) for row in removed.to_dict("records")])
+    return len(removed)
+
+
+def drop_rows(mask, changes):
+    # Remove rows by position in the current table, e.g. rows failing
+    # validation; callers hold write_lock() while computing the mask. The
+    # running statistics rebuild on their next load.
+    init_store()
+    with write_lock():
+        frame = load_scores().to_pandas()
+        _write_all(frame[~mask])
+        with _snapshot_lock:
+            rebuild_snapshot()
+        changefeed.record(changes)
+
+
+def remove_rounds(rounds):
+    # Drop whole rounds from the live store once they are archived. The
+    # scores themselves are unchanged, so no delete events are recorded;
+    # backup bases include the archive instead.
+    init_store()
+    with write_lock():
+        table = load_scores()
+        mask = pc.is_in(table["Round"], pa.array(rounds, pa.string()))
+        removed = pc.sum(mask).as_py() or 0
+        if removed:
+            _write_all(table.filter(pc.invert(mask)).to_pandas())
+            with _snapshot_lock:
+                rebuild_snapshot()
+    return removed
+
+
+def filter_expression(rounds=None, institutions=None, categories=None, questions=None, assessors=None, aspects=None):
+    # Dataset filter for the given selections; None or empty means no
+    # restriction. Categories match the SI/ZT/HP prefix of the question.
+    conditions = []
+    if categories:
+        prefixes = [pc.starts_with(ds.field("Question"), pattern=f"{category} ") for category in categories]
+        conditions.append(functools.reduce(operator.or_, prefixes))
+    for column, values in [
+        ("Round", rounds),
+        ("Institution", institutions),
+        ("Question", questions),
+        ("Assessor", assessors),
+        ("Key Aspect", aspects),
+    ]:
+        if values:
+            conditions.append(ds.field(column).isin(list(values)))
+    return functools.reduce(operator.and_, conditions) if conditions else None
+
+
+def query_live(expression=None, columns=None, table=None):
+    # Only the filter columns are scanned and only matching rows are copied
+    # out of the memory-mapped snapshot
+    return ds.dataset(table if table is not None else load_scores()).to_table(columns=columns, filter=expression)
+
+
+def filter_question(table, question):
+    return table.filter(pc.equal(table["Question"], question))
+
+
+def aspect_means(table):
+    means = table.group_by("Key Aspect").aggregate([("Score", "mean")])
+    means = means.select(["Key Aspect", "Score_mean"]).rename_columns(["Key Aspect", "Score"])
+    means = means.sort_by("Key Aspect")
+    return means.to_pandas()
+
+
+def export_csv(table):
+    sink = pa.BufferOutputStream()
+    pacsv.write_csv(table, sink)
+    return sink.getvalue().to_pybytes()
@@ -0,0 +1,102 @@
+import os
+import threading
+from collections import OrderedDict
+
+import plotly.express as px
+import plotly.io as pio
+import pyarrow.compute as pc
+
+import metrics
+import store
+
+# Bounds on the per-question results kept in memory; the least recently
+# used question is evicted first when either is exceeded
+MAX_ENTRIES = int(os.environ.get("HURS_SUMMARY_CACHE_ENTRIES", 64))
+MAX_BYTES = int(os.environ.get("HURS_SUMMARY_CACHE_MB", 256)) * 1024 * 1024
+
+metrics.HELP.update({
+    "hurs_summary_cache_hits_total": "Per-question summaries served from memory",
+    "hurs_summary_cache_misses_total": "Per-question summaries computed",
+    "hurs_summary_cache_evictions_total": "Per-question summaries dropped, by reason",
+    "hurs_summary_cache_entries": "Per-question summaries held in memory",
+    "hurs_summary_cache_bytes": "Approximate size of the held summaries",
+})
+
+# Per-question results keyed by (question, data version), shared by every
+# session in the process and filled ahead of time by the warm-up
+_cache = OrderedDict()
+_cache_bytes = 0
+_lock = threading.Lock()
+
+
+def questions(table):
+    return pc.unique(table["Question"]).to_pylist() if table.num_rows else []
+
+
+def _evict(key, reason):
+    global _cache_bytes
+    _cache_bytes -= _cache.pop(key)["bytes"]
+    metrics.inc("hurs_summary_cache_evictions_total", reason=reason)
+
+
+def _build(table, question):
+    filtered = store.filter_question(table, question)
+    means = fig = fig_json = None
+    size = filtered.nbytes
+    if filtered.num_rows:
+        means = store.aspect_means(filtered)
+        fig = px.bar(
+            means,
+            x="Key Aspect",
+            y="Score",
+            color="Key Aspect",
+            title=f"Scores for {question}",
+            labels={"Score": "Average Score"}
+        )
+        fig_json = pio.to_json(fig, validate=False)
+        size += int(means.memory_usage(deep=True).sum()) + 2 * len(fig_json)
+    return {"filtered": filtered, "means": means, "fig": fig, "fig_json": fig_json, "bytes": size}
+
+
+def _entry(table, version, question):
+    global _cache_bytes
+    key = (question, version)
+    with _lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            metrics.inc("hurs_summary_cache_hits_total")
+            return _cache[key]
+
+    metrics.inc("hurs_summary_cache_misses_total")
+    entry = _build(table, question)
+
+    with _lock:
+        # Entries of older data versions can never be hit again
+        for stale in [k for k in _cache if k[1] != version]:
+            _evict(stale, "stale")
+        if key in _cache:  # another session built it meanwhile
+            return _cache[key]
+        _cache[key] = entry
+        _cache_bytes += entry["bytes"]
+        while len(_cache) > 1 and (len(_cache) > MAX_ENTRIES or _cache_bytes > MAX_BYTES):
+            _evict(next(iter(_cache)), "size")
+        metrics.set_gauge("hurs_summary_cache_entries", len(_cache))
+        metrics.set_gauge("hurs_summary_cache_bytes", _cache_bytes)
+    return entry
+
+
+def question_summary(table, version, question):
+    # (filtered rows, mean score per key aspect, bar chart) for one question
+    entry = _entry(table, version, question)
+    return entry["filtered"], entry["means"], entry["fig"]
+
+
+def figure_json(table, version, question):
+    # The bar chart as Plotly JSON, serialized once per data version
+    return _entry(table, version, question)["fig_json"]
+
+
+def cache_info():
+    # (entries, approximate bytes) of the cache
+    with _lock:
+        return len(_cache), _cache_bytes
@@ -0,0 +1,141 @@
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+import statefile
+
+# Score sums and counts per round, institution and indicator or category,
+# kept in step with scores.csv and the archive
+views_file = Path("round_views.json")
+
+LEVELS = {"Indicator": "Question", "Category": "Category"}
+
+
+def _aggregate(frame):
+    # {round: {(level, institution, indicator or category): [sum, count]}}
+    frame = frame.dropna(subset=["Score"])
+    frame = frame.assign(
+        Institution=frame["Institution"].fillna(""),
+        Category=frame["Question"].str.split(" ", n=1).str[0],
+    )
+    views = {}
+    for level, column in LEVELS.items():
+        agg = frame.groupby(["Round", "Institution", column])["Score"].agg(["sum", "count"])
+        for (round_, institution, key), total, count in zip(agg.index, agg["sum"], agg["count"]):
+            views.setdefault(round_, {})[(level, institution, key)] = [float(total), int(count)]
+    return views
+
+
+def _columns(table):
+    return table.select(["Round", "Institution", "Question", "Score"]).to_pandas()
+
+
+def _dump_views(views):
+    return {round_: [[*key, *value] for key, value in groups.items()] for round_, groups in views.items()}
+
+
+def _load_views(payload):
+    return {round_: {tuple(row[:3]): row[3:] for row in rows} for round_, rows in payload.items()}
+
+
+# Saved as (views of live rows, views of archived rows)
+_state = statefile.VersionedState(
+    views_file,
+    lambda state: {"live": _dump_views(state[0]), "archived": _dump_views(state[1])},
+    lambda payload: (_load_views(payload["live"]), _load_views(payload["archived"])),
+)
+
+
+def load_views(table, history=None):
+    # Live views are rebuilt only when the store changed behind the
+    # incremental updates; archived rounds are aggregated once each
+    def rebuild(table, saved):
+        live = _aggregate(_columns(table))
+        archived = saved[1] if saved is not None else {}
+        if history is not None:
+            rounds = pc.unique(history.to_table(columns=["Round"])["Round"]).to_pylist()
+            archived = {round_: groups for round_, groups in archived.items() if round_ in rounds}
+            for round_ in set(rounds) - set(archived):
+                rows = history.to_table(filter=ds.field("Round") == round_)
+                archived[round_] = _aggregate(_columns(rows)).get(round_, {})
+        return live, archived
+
+    return _combined(*_state.get(table, rebuild))
+
+
+def _combined(live, archived):
+    views = {round_: dict(groups) for round_, groups in archived.items()}
+    for round_, groups in live.items():
+        merged = views.setdefault(round_, {})
+        for key, (total, count) in groups.items():
+            previous = merged.get(key, [0.0, 0])
+            merged[key] = [previous[0] + total, previous[1] + count]
+    return views
+
+
+def apply_rows(rows, before, after, removed=None):
+    # Add saved rows to, and take replaced or deleted rows from, the views
+    # of their rounds. If the views do not match the store as it was before
+    # the save, leave them for load_views to rebuild.
+    def update(state):
+        live, archived = state
+        for frame, sign in [(removed, -1), (rows, 1)]:
+            if frame is None or frame.empty:
+                continue
+            for round_, groups in _aggregate(frame[["Round", "Institution", "Question", "Score"]]).items():
+                views = live.setdefault(round_, {})
+                for key, (total, count) in groups.items():
+                    previous = views.get(key, [0.0, 0])
+                    views[key] = [previous[0] + sign * total, previous[1] + sign * count]
+                    if views[key][1] <= 0:
+                        del views[key]
+        return {round_: groups for round_, groups in live.items() if groups}, archived
+
+    _state.apply(before, after, update)
+
+
+def set_archived(round_, table):
+    # Called when a round's archive partitions are rewritten; the live
+    # views are refreshed by the version change that follows
+    def update(state):
+        live, archived = state
+        archived[round_] = _aggregate(_columns(table)).get(round_, {})
+        return live, archived
+
+    _state.replace(update)
+
+
+def rounds(views):
+    return sorted(views, reverse=True)
+
+
+def compare(views, first, second, level="Indicator", institution=None):
+    # Mean score per indicator or category in two rounds, and the change
+    if first == second:
+        raise ValueError(f"Pick two different rounds to compare, not {first} twice")
+    records = [
+        (round_, key, total, count)
+        for round_ in (first, second)
+        for (row_level, row_institution, key), (total, count) in views.get(round_, {}).items()
+        if row_level == level and (institution is None or row_institution == institution)
+    ]
+    frame = pd.DataFrame(records, columns=["Round", level, "Sum", "Count"])
+    if frame.empty:
+        return pd.DataFrame(columns=[level, f"Mean {first}", f"Mean {second}", "Change", f"Count {first}", f"Count {second}"])
+    totals = frame.groupby([level, "Round"])[["Sum", "Count"]].sum()
+    means = (totals["Sum"] / totals["Count"]).unstack("Round").reindex(columns=[first, second])
+    counts = totals["Count"].unstack("Round").reindex(columns=[first, second]).fillna(0).astype(int)
+    result = pd.DataFrame({
+        f"Mean {first}": means[first],
+        f"Mean {second}": means[second],
+        "Change": means[second] - means[first],
+        f"Count {first}": counts[first],
+        f"Count {second}": counts[second],
+    })
+    return result.reset_index()
+
+
+def institutions(views, round_list):
+    return sorted({institution for round_ in round_list for (_, institution, _) in views.get(round_, {}) if institution})
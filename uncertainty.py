@@ -0,0 +1,142 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+import weights
+
+# Replicates per pool task. Fixed so results only depend on the seed, not
+# on how many workers happen to be available.
+TASK_REPLICATES = 250
+
+# Upper bound on the replicate x row weight matrix built at once, and the
+# bytes each of its cells takes at the peak of a replicate block
+MAX_CELLS = 4_000_000
+BYTES_PER_CELL = 8
+
+# Memory all pool workers may use together; fewer workers are started when
+# one worker's share would not fit
+MEMORY_BUDGET = int(os.environ.get("HURS_BOOTSTRAP_MB", 1024)) * 1024 * 1024
+
+# Arrays shared with the pool workers, set once per worker process
+_data = None
+
+
+def prepare(frame, questions_data, category_weights):
+    # Sort rows by (institution, indicator) so every group is one contiguous
+    # slice that np.add.reduceat can sum per replicate
+    indicators = list(questions_data)
+    frame = frame.dropna(subset=["Institution", "Score"])
+    frame = frame[frame["Question"].isin(indicators)]
+    institution_codes, institutions = pd.factorize(frame["Institution"], sort=True)
+    indicator_codes = pd.Categorical(frame["Question"], categories=indicators).codes
+    assessor_codes, _ = pd.factorize(frame["Assessor"])
+    item_codes, _ = pd.factorize(frame["Question"] + "\x1f" + frame["Key Aspect"] + "\x1f" + frame["Item"].fillna(""))
+
+    groups = institution_codes * len(indicators) + indicator_codes
+    order = np.argsort(groups, kind="stable")
+    groups = groups[order]
+    starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+    scores = frame["Score"].to_numpy(dtype=float)[order]
+
+    return institutions.tolist(), {
+        "scores": scores,
+        "assessors": assessor_codes[order],
+        "items": item_codes[order],
+        "n_assessors": assessor_codes.max() + 1 if len(order) else 0,
+        "n_items": item_codes.max() + 1 if len(order) else 0,
+        "starts": starts,
+        "groups": groups[starts],
+        "observed": np.add.reduceat(scores, starts) / np.diff(np.r_[starts, len(scores)]),
+        "shape": (len(institutions), len(indicators)),
+        "weights": weights.base_weights(questions_data, category_weights),
+    }
+
+
+def institution_scores(data, group_means):
+    # Indicators an institution has no scores for count as 0, as in the
+    # what-if simulator
+    n_institutions, n_indicators = data["shape"]
+    means = np.zeros((len(group_means), n_institutions * n_indicators))
+    means[:, data["groups"]] = group_means
+    return means.reshape(len(group_means), n_institutions, n_indicators) @ data["weights"]
+
+
+def _chunk(data, n_replicates):
+    return max(1, min(n_replicates, MAX_CELLS // max(len(data["scores"]), 1)))
+
+
+def replicate_ranks(data, n_replicates, seed):
+    # Poisson bootstrap: every assessor and every item gets an independent
+    # Poisson(1) weight per replicate, which approximates resampling them
+    # with replacement and keeps each replicate a pair of array operations.
+    # Poisson(1) draws stay far below 255, so weights fit in uint8 and their
+    # products in uint16; weighted scores are float32 and counts exact.
+    rng = np.random.default_rng(seed)
+    chunk = _chunk(data, n_replicates)
+    scores = data["scores"].astype(np.float32)
+    ranks = []
+    for done in range(0, n_replicates, chunk):
+        size = min(chunk, n_replicates - done)
+        assessor_weights = rng.poisson(1.0, (size, data["n_assessors"])).astype(np.uint8)
+        item_weights = rng.poisson(1.0, (size, data["n_items"])).astype(np.uint8)
+        row_weights = np.multiply(
+            assessor_weights[:, data["assessors"]], item_weights[:, data["items"]], dtype=np.uint16
+        )
+
+        totals = np.add.reduceat(row_weights * scores, data["starts"], axis=1, dtype=np.float64)
+        counts = np.add.reduceat(row_weights, data["starts"], axis=1, dtype=np.uint32)
+        del row_weights
+        # A group that drew no weight at all keeps its observed mean
+        with np.errstate(invalid="ignore", divide="ignore"):
+            group_means = np.where(counts > 0, totals / counts, data["observed"])
+
+        ranks.append(weights.rank_columns(institution_scores(data, group_means).T))
+    return np.hstack(ranks)
+
+
+def _init_worker(data):
+    global _data
+    _data = data
+
+
+def _run_task(task):
+    seed, n_replicates = task
+    return replicate_ranks(_data, n_replicates, seed)
+
+
+def bootstrap_ranks(data, n_replicates, seed=0, max_workers=None):
+    # Spread fixed-size blocks of replicates across CPU cores, each with its
+    # own child of one SeedSequence so runs are reproducible
+    sizes = [TASK_REPLICATES] * (n_replicates // TASK_REPLICATES)
+    if n_replicates % TASK_REPLICATES:
+        sizes.append(n_replicates % TASK_REPLICATES)
+    tasks = list(zip(np.random.SeedSequence(seed).spawn(len(sizes)), sizes))
+
+    # Each worker holds its copy of data plus one replicate block at a time
+    per_worker = BYTES_PER_CELL * _chunk(data, TASK_REPLICATES) * len(data["scores"])
+    per_worker += sum(value.nbytes for value in data.values() if isinstance(value, np.ndarray))
+    max_workers = min(max_workers or os.cpu_count() or 1, len(tasks), max(1, MEMORY_BUDGET // per_worker))
+    if max_workers <= 1:
+        return np.hstack([replicate_ranks(data, n, task_seed) for task_seed, n in tasks])
+    # Forking the Streamlit server, with its threads and held locks, can
+    # deadlock the workers; start them from a clean forkserver instead
+    context = multiprocessing.get_context("forkserver")
+    with ProcessPoolExecutor(max_workers, mp_context=context, initializer=_init_worker, initargs=(data,)) as pool:
+        return np.hstack(list(pool.map(_run_task, tasks)))
+
+
+def rank_intervals(institutions, data, ranks, level=0.95):
+    observed = institution_scores(data, data["observed"][None, :])
+    observed_ranks = weights.rank_columns(observed.T)[:, 0]
+    tail = (1 - level) / 2 * 100
+    return pd.DataFrame({
+        "Institution": institutions,
+        "Score": observed[0],
+        "Rank": observed_ranks,
+        "Median Rank": np.median(ranks, axis=1),
+        "Rank Interval Low": np.percentile(ranks, tail, axis=1, method="lower"),
+        "Rank Interval High": np.percentile(ranks, 100 - tail, axis=1, method="higher"),
+    }).sort_values("Rank").reset_index(drop=True)
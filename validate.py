@@ -0,0 +1,116 @@
+import argparse
+import functools
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import store
+from rubric import RUBRIC_VERSION, questions_data
+
+# Rows removed by --fix, kept with the reason they failed
+quarantine_file = Path("quarantine.csv")
+
+# Checks in the order they are reported; a row gets the first one it fails
+VIOLATIONS = ["Unknown question", "Unknown key aspect", "Unknown item", "Score outside 0-1", "Duplicate submission"]
+
+
+@functools.lru_cache(maxsize=2)
+def compiled_rubric(version=RUBRIC_VERSION):
+    # Every question, key aspect name and item text gets an integer code;
+    # the valid (question, aspect) and (question, aspect, item) combinations
+    # are stored as packed integer keys. Built once per rubric version.
+    triples = [
+        (question, aspect, item)
+        for question, data in questions_data.items()
+        for aspect, aspect_items in data["Key Aspects"].items()
+        for item in aspect_items
+    ]
+    questions = pd.Index(list(questions_data))
+    aspects = pd.Index(sorted({aspect for _, aspect, _ in triples}))
+    items = pd.Index(sorted({item for _, _, item in triples}))
+    q = questions.get_indexer([t[0] for t in triples])
+    a = aspects.get_indexer([t[1] for t in triples])
+    i = items.get_indexer([t[2] for t in triples])
+    pairs = q.astype(np.int64) * len(aspects) + a
+    return {
+        "questions": questions,
+        "aspects": aspects,
+        "items": items,
+        "valid_aspects": np.unique(pairs),
+        "valid_items": np.unique(pairs * len(items) + i),
+    }
+
+
+def find_violations(frame):
+    # One label per row (None when the row is valid). Every check is a hash
+    # lookup or integer set membership over whole columns.
+    index = compiled_rubric()
+    q = index["questions"].get_indexer(frame["Question"])
+    a = index["aspects"].get_indexer(frame["Key Aspect"])
+    i = index["items"].get_indexer(frame["Item"])
+    pairs = q.astype(np.int64) * len(index["aspects"]) + a
+    has_item = (frame["Item"].notna() & (frame["Item"] != "")).to_numpy()
+    score = pd.to_numeric(frame["Score"], errors="coerce").to_numpy()
+
+    # Older copies of a key; the most recently stored row is kept
+    key_codes = pd.DataFrame({column: pd.factorize(frame[column])[0] for column in store.KEY})
+    duplicated = has_item & key_codes.duplicated(keep="last").to_numpy()
+
+    checks = [
+        q < 0,
+        (a < 0) | ~np.isin(pairs, index["valid_aspects"]),
+        has_item & ((i < 0) | ~np.isin(pairs * len(index["items"]) + i, index["valid_items"])),
+        np.isnan(score) | (score < 0) | (score > 1),
+        duplicated,
+    ]
+    violations = np.full(len(frame), None, dtype=object)
+    for name, failed in reversed(list(zip(VIOLATIONS, checks))):
+        violations[failed] = name
+    return pd.Series(violations, index=frame.index)
+
+
+def report(frame):
+    violations = find_violations(frame)
+    counts = violations.value_counts().reindex(VIOLATIONS, fill_value=0)
+    bad_rows = frame[violations.notna()].assign(Violation=violations.dropna())
+    return counts, bad_rows
+
+
+def fix():
+    # Drop superseded duplicates and move every other failing row to the
+    # quarantine file, recording delete events for keys that disappear
+    with store.write_lock():
+        frame = store.load_scores().to_pandas()
+        violations = find_violations(frame)
+        failing = violations.notna().to_numpy()
+        if not failing.any():
+            return 0, 0
+
+        quarantined = frame[violations.notna() & (violations != "Duplicate submission")]
+        if not quarantined.empty:
+            quarantined.assign(Violation=violations[quarantined.index]).to_csv(
+                quarantine_file, mode="a", header=not quarantine_file.exists(), index=False
+            )
+        gone = quarantined[~store.key_mask(quarantined, frame[~failing])]
+        store.drop_rows(failing, [("delete", row) for row in gone[store.COLUMNS].to_dict("records")])
+    return len(quarantined), int(failing.sum()) - len(quarantined)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the HURS score store against the rubric")
+    parser.add_argument("--fix", action="store_true", help="drop duplicates and quarantine other failing rows")
+    parser.add_argument("--show", type=int, default=20, help="failing rows to print")
+    args = parser.parse_args()
+
+    counts, bad_rows = report(store.load_scores().to_pandas())
+    print(counts.to_string())
+    if not bad_rows.empty:
+        print(bad_rows.head(args.show).to_string())
+    if args.fix:
+        quarantined, deduplicated = fix()
+        print(f"Quarantined {quarantined} rows to {quarantine_file}, removed {deduplicated} duplicates")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import threading
+import time
+
+import archive
+import rubric
+import stats
+import store
+import summary
+import trends
+
+# Warm-up status for this process, reported by the /ready endpoint
+status = {"started": None, "finished": None, "error": None}
+_lock = threading.Lock()
+
+
+def run():
+    # Map the score snapshot and build the shared summary caches once,
+    # before the first user has to wait for them
+    for question in rubric.questions_data:
+        rubric.question_layout(question)
+    table = store.load_scores()
+    version = store.table_version(table)
+    stats.load_stats(table)
+    trends.load_views(table, archive.history())
+    for question in summary.questions(table):
+        summary.question_summary(table, version, question)
+
+
+def _run_and_record():
+    try:
+        run()
+    except Exception as error:  # sessions fill the caches lazily; /ready reports it
+        status["error"] = repr(error)
+    status["finished"] = time.time()
+
+
+def start():
+    # Once per process; later calls return immediately
+    with _lock:
+        if status["started"] is not None:
+            return
+        status["started"] = time.time()
+    threading.Thread(target=_run_and_record, name="hurs-warmup", daemon=True).start()
+
+
+def not_ready():
+    # None once the warm-up succeeded, else the reason for GET /ready
+    if status["finished"] is None:
+        return "warming up"
+    if status["error"] is not None:
+        return f"warm-up failed: {status['error']}"
+    return None
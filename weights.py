@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+
+# HURS categories, taken from the prefix of each indicator name
+CATEGORIES = ["SI", "ZT", "HP"]
+
+
+def indicator_categories(questions_data):
+    indicators = list(questions_data)
+    return indicators, np.array([indicator.split()[0] for indicator in indicators])
+
+
+def base_weights(questions_data, category_weights):
+    # Each category's weight is split evenly across its indicators
+    indicators, categories = indicator_categories(questions_data)
+    weights = np.zeros(len(indicators))
+    for category, weight in category_weights.items():
+        members = categories == category
+        if members.any():
+            weights[members] = weight / members.sum()
+    return weights / weights.sum()
+
+
+def random_scenarios(questions_data, category_weights, n_scenarios, concentration, seed=None):
+    # Dirichlet draws centred on the base weights: category weights first,
+    # then each category's share split across its indicators. Higher
+    # concentration keeps scenarios closer to the base weights.
+    rng = np.random.default_rng(seed)
+    indicators, categories = indicator_categories(questions_data)
+    weighted = [c for c in CATEGORIES if category_weights.get(c, 0) > 0]
+    base = np.array([category_weights[c] for c in weighted], dtype=float)
+    category_draws = rng.dirichlet(concentration * base / base.sum(), n_scenarios)
+
+    scenarios = np.zeros((n_scenarios, len(indicators)))
+    for col, category in enumerate(weighted):
+        members = np.flatnonzero(categories == category)
+        if not len(members):
+            continue
+        within = rng.dirichlet(np.full(len(members), float(concentration)), n_scenarios)
+        scenarios[:, members] = category_draws[:, [col]] * within
+    return scenarios / scenarios.sum(axis=1, keepdims=True)
+
+
+def uploaded_scenarios(questions_data, frame):
+    # One scenario per row, with a column per indicator or per category.
+    # Category columns are split evenly across their indicators.
+    indicators, categories = indicator_categories(questions_data)
+    if set(CATEGORIES) & set(frame.columns):
+        category_matrix = frame.reindex(columns=CATEGORIES).fillna(0).to_numpy(dtype=float)
+        sizes = np.array([(categories == c).sum() for c in CATEGORIES])
+        expand = (categories[None, :] == np.array(CATEGORIES)[:, None]) / np.maximum(sizes, 1)[:, None]
+        scenarios = category_matrix @ expand
+    else:
+        scenarios = frame.reindex(columns=indicators).fillna(0).to_numpy(dtype=float)
+    totals = scenarios.sum(axis=1)
+    keep = totals > 0
+    return scenarios[keep] / totals[keep, None]
+
+
+def score_matrix(frame, questions_data):
+    # Mean item score per institution and indicator; indicators an
+    # institution has not been scored on count as 0
+    indicators = list(questions_data)
+    pivot = frame.pivot_table(index="Institution", columns="Question", values="Score", aggfunc="mean")
+    pivot = pivot.reindex(columns=indicators).fillna(0)
+    return list(pivot.index), pivot.to_numpy()
+
+
+def rank_columns(totals):
+    # Rank 1 is the highest score in each column; ties keep institution order
+    order = np.argsort(-totals, axis=0, kind="stable")
+    ranks = np.empty_like(order)
+    positions = np.arange(1, totals.shape[0] + 1)[:, None]
+    np.put_along_axis(ranks, order, np.broadcast_to(positions, order.shape), axis=0)
+    return ranks
+
+
+def simulate(matrix, scenarios):
+    # institutions x indicators @ indicators x scenarios, ranked per scenario
+    totals = matrix @ scenarios.T
+    return totals, rank_columns(totals)
+
+
+def rank_stability(institutions, matrix, base, scenarios):
+    base_totals, base_ranks = simulate(matrix, base[None, :])
+    _, ranks = simulate(matrix, scenarios)
+    return pd.DataFrame({
+        "Institution": institutions,
+        "Base Score": base_totals[:, 0],
+        "Base Rank": base_ranks[:, 0],
+        "Median Rank": np.median(ranks, axis=1),
+        "Best Rank": ranks.min(axis=1),
+        "Worst Rank": ranks.max(axis=1),
+        "Rank Std": ranks.std(axis=1),
+        "Share at Base Rank": (ranks == base_ranks).mean(axis=1),
+    }).sort_values("Base Rank").reset_index(drop=True)